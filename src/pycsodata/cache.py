@@ -30,19 +30,23 @@ class CacheInfo:
         ttl_seconds: Time-to-live for cached entries in seconds.
         hit_rate: Ratio of cache hits to total requests (0.0-1.0), or None if
             no requests have been made.
+        disk_size: Number of responses persisted to the disk cache (0 if the
+            disk cache is disabled).
     """
 
     size: int
     maxsize: int
     ttl_seconds: float
     hit_rate: float | None
+    disk_size: int = 0
 
     def __repr__(self) -> str:
         """Return a string representation of the cache info."""
         hit_rate_str = f"{self.hit_rate:.1%}" if self.hit_rate is not None else "N/A"
         return (
             f"CacheInfo(size={self.size}, maxsize={self.maxsize}, "
-            f"ttl_seconds={self.ttl_seconds}, hit_rate={hit_rate_str})"
+            f"ttl_seconds={self.ttl_seconds}, hit_rate={hit_rate_str}, "
+            f"disk_size={self.disk_size})"
         )
 
 
@@ -56,6 +60,10 @@ class CSOCache:
     The cache is shared across all instances of CSOCache, CSODataset, and
     CSOCatalogue. Operations on one instance affect all users of the cache.
 
+    Responses can additionally be persisted to disk across sessions by setting
+    the ``PYCSODATA_DISK_CACHE`` environment variable to ``1``. Flushing the
+    cache also clears the disk cache.
+
     Methods:
         info: Get information about the current cache state.
         flush: Clear all cached responses.
@@ -82,6 +90,7 @@ class CSOCache:
                 - maxsize: Maximum cache capacity.
                 - ttl_seconds: Time-to-live for cached entries in seconds.
                 - hit_rate: Ratio of cache hits to total requests, or None.
+                - disk_size: Number of responses persisted to disk.
 
         Examples:
             >>> cache = CSOCache()
@@ -96,6 +105,7 @@ class CSOCache:
             maxsize=raw_info["maxsize"],
             ttl_seconds=raw_info["ttl_seconds"],
             hit_rate=raw_info.get("hit_rate"),
+            disk_size=raw_info.get("disk_size", 0),
         )
 
     def flush(self) -> None:
@@ -23,13 +23,14 @@ from pycsodata.constants import (
 from pycsodata.fetchers import fetch_json
 from pycsodata.sanitise import sanitise_list, sanitise_string
 from pycsodata.search import (
-    count_matching_terms,
+    count_matching_terms_series,
     date_in_date_range,
     date_range_overlaps,
     extract_search_terms,
     parse_date_input,
     parse_date_range_tuple,
     parse_search_expression,
+    parse_single_term,
     parse_string_search_expression,
 )
 
@@ -271,20 +272,14 @@ class CSOCatalogue:
         if title:
             title_terms = extract_search_terms(title)
             if title_terms:
-                scores += df["Title"].apply(lambda text: count_matching_terms(text, title_terms))
+                scores += count_matching_terms_series(df["Title"], title_terms)
 
         # Calculate relevance of variables
         if variables:
             var_terms = extract_search_terms(variables)
             if var_terms:
-
-                def count_var_matches(var_list: list[str]) -> int:
-                    if not var_list:
-                        return 0
-                    combined = " ".join(var_list)
-                    return count_matching_terms(combined, var_terms)
-
-                scores += df["Variables"].apply(count_var_matches)
+                combined = df["Variables"].apply(lambda var_list: " ".join(var_list or []))
+                scores += count_matching_terms_series(combined, var_terms)
 
         return scores
 
@@ -387,6 +382,11 @@ class CSOCatalogue:
         Returns:
             A boolean Series indicating which rows match the expression.
         """
+        term = parse_single_term(query)
+        if term is not None:
+            # A lone term is a plain substring test, which pandas can vectorise
+            return series.str.lower().str.contains(term, regex=False, na=False)
+
         matcher = parse_string_search_expression(query)
         return series.apply(lambda text: matcher(text) if pd.notna(text) else False)
 
@@ -409,7 +409,7 @@ class CSOCatalogue:
         def match_items(items: list[str]) -> bool:
             if not items:
                 return False
-            return matcher([item.lower() for item in items])
+            return matcher(items)
 
         return series.apply(match_items)
 
@@ -12,9 +12,10 @@ Examples:
 
 from __future__ import annotations
 
-import geopandas as gpd
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 import pandas as pd
-from pyjstat import pyjstat
 
 from pycsodata._types import (
     DatasetMetadata,
@@ -36,6 +37,7 @@ from pycsodata.fetchers import load_dataset, load_metadata
 from pycsodata.parsers import (
     extract_id_mapping,
     extract_spatial_info,
+    json_stat_to_dataframe,
     parse_metadata,
     parse_temporal_column,
 )
@@ -45,8 +47,11 @@ from pycsodata.sanitise import (
     sanitise_list,
     sanitise_string,
 )
-from pycsodata.spatial import create_geodataframe, create_met_geodataframe
-from pycsodata.ungeneralised import create_ungeneralised_geodataframe
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import geopandas as gpd
 
 
 class CSODataset:
@@ -119,6 +124,9 @@ class CSODataset:
         self._sanitise = sanitise
         self._cache_enabled = cache
 
+        # Normalise filter keys/values once (STATISTIC -> Statistic, sanitisation)
+        self._normalised_filters = self._normalise_filter_keys(filters) if filters else None
+
         # Load metadata (eagerly, to fail fast on invalid table codes)
         self._raw_metadata = load_metadata(table_code, cache=cache)
 
@@ -151,6 +159,9 @@ class CSODataset:
         self._cached_df: pd.DataFrame | None = None
         self._cached_gdf: gpd.GeoDataFrame | None = None
         self._cached_gdf_ungeneralised: gpd.GeoDataFrame | None = None
+        # Pivoted frames keyed by (source, format); sources are "df", "gdf"
+        # and "gdf_ungeneralised", so at most six entries are ever held
+        self._cached_pivots: dict[tuple[str, PivotFormat], pd.DataFrame] = {}
 
     # =========================================================================
     # Properties
@@ -164,11 +175,23 @@ class CSODataset:
         its title, variables, units, time variable, and other attributes.
 
         If sanitise=True was specified during initialisation, variable names
-        and other fields are sanitised for consistency.
+        and other fields are sanitised for consistency. The metadata is parsed
+        once; each access returns a copy, so changes to it do not affect the
+        dataset.
 
         Returns:
             A DatasetMetadata TypedDict with all available metadata fields.
         """
+        return DatasetMetadata(
+            **{
+                key: value.copy() if isinstance(value, list) else value
+                for key, value in self._metadata.items()
+            }
+        )
+
+    @cached_property
+    def _metadata(self) -> DatasetMetadata:
+        """Parse (and sanitise, if enabled) the raw metadata on first access."""
         meta = parse_metadata(self._raw_metadata)
         if self._sanitise:
             meta = self._sanitise_metadata(meta)
@@ -199,7 +222,7 @@ class CSODataset:
         """
         return self._spatial_info
 
-    @property
+    @cached_property
     def has_spatial_data(self) -> bool:
         """Check if this dataset has spatial data available.
 
@@ -246,11 +269,11 @@ class CSODataset:
             return self._cached_df.copy() if copy else self._cached_df
 
         if fmt == PivotFormat.WIDE:
-            result = self._pivot_wide(self._cached_df)
+            result = self._get_cached_pivot("df", fmt, self._cached_df, self._pivot_wide)
             return result.copy() if copy else result
 
         if fmt == PivotFormat.TIDY:
-            result = self._pivot_tidy(self._cached_df)
+            result = self._get_cached_pivot("df", fmt, self._cached_df, self._pivot_tidy)
             return result.copy() if copy else result
 
         return self._cached_df.copy() if copy else self._cached_df
@@ -336,8 +359,10 @@ class CSODataset:
 
         # Select the appropriate cache and builder
         if ungeneralised:
+            source = "gdf_ungeneralised"
             if force_reload_geometries:
                 self._cached_gdf_ungeneralised = None
+                self._clear_cached_pivots(source)
             if self._cached_gdf_ungeneralised is None:
                 self._cached_gdf_ungeneralised = self._build_gdf(
                     ungeneralised=True,
@@ -345,6 +370,7 @@ class CSODataset:
                 )
             cached_gdf = self._cached_gdf_ungeneralised
         else:
+            source = "gdf"
             if self._cached_gdf is None:
                 self._cached_gdf = self._build_gdf()
             cached_gdf = self._cached_gdf
@@ -353,11 +379,11 @@ class CSODataset:
             return cached_gdf.copy() if copy else cached_gdf
 
         if fmt == PivotFormat.WIDE:
-            result = self._gdf_pivot_wide(cached_gdf)
+            result = self._get_cached_pivot(source, fmt, cached_gdf, self._gdf_pivot_wide)
             return result.copy() if copy else result
 
         if fmt == PivotFormat.TIDY:
-            result = self._gdf_pivot_tidy(cached_gdf)
+            result = self._get_cached_pivot(source, fmt, cached_gdf, self._gdf_pivot_tidy)
             return result.copy() if copy else result
 
         return cached_gdf.copy() if copy else cached_gdf
@@ -377,10 +403,15 @@ class CSODataset:
         printer.print_all()
 
     def __repr__(self) -> str:
-        """Return a string representation of the dataset."""
+        """Return a string representation of the dataset.
+
+        Only state held on the instance is shown, so calling repr() never
+        triggers a data download or pivot.
+        """
         spatial = "yes" if self.has_spatial_data else "no"
+        filters = f", filters={self._filters!r}" if self._filters else ""
 
-        return f"<CSODataset(table_code='{self.table_code}', spatial={spatial})>"
+        return f"<CSODataset(table_code='{self.table_code}', spatial={spatial}{filters})>"
 
     # =========================================================================
     # Private: Data Loading
@@ -495,15 +526,12 @@ class CSODataset:
             The processed DataFrame ready for further transformation.
 
         Raises:
-            TypeError: If the API response cannot be parsed into a DataFrame.
+            ValueError: If the API response is not a consistent JSON-stat dataset.
         """
         dataset_json = load_dataset(self.table_code, cache=self._cache_enabled)
 
         # Parse JSON-stat to DataFrame
-        df = pyjstat.from_json_stat(dataset_json)[0]
-
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(f"Expected DataFrame, got {type(df).__name__}")
+        df = json_stat_to_dataframe(dataset_json)
 
         # normalise column names FIRST (STATISTIC -> Statistic, etc.)
         # This must happen before adding ID columns and applying filters
@@ -568,6 +596,13 @@ class CSODataset:
         Raises:
             SpatialError: If spatial merge fails or produces invalid geometry.
         """
+        # Spatial dependencies are imported on first use so that df()-only
+        # workflows never pay the geopandas/shapely/pyproj import cost
+        import geopandas as gpd
+
+        from pycsodata.spatial import create_geodataframe, create_met_geodataframe
+        from pycsodata.ungeneralised import create_ungeneralised_geodataframe
+
         base_df = self._get_base_df().copy()
 
         # Create GeoDataFrame BEFORE dropping columns, so spatial merge works
@@ -679,7 +714,10 @@ class CSODataset:
     ) -> pd.DataFrame | gpd.GeoDataFrame:
         """Filter ID columns based on include_ids setting.
 
-        Handles three cases:
+        include_ids is normalised to an IncludeIDs member (or a list) at
+        construction, so the modes are distinguished by identity checks.
+
+        Handles four cases:
         1. IncludeIDs.ALL: Keep all ID columns.
         2. IncludeIDs.SPATIAL_ONLY: Keep only the spatial dimension ID column.
         3. IncludeIDs.NONE: Remove all ID columns.
@@ -690,18 +728,18 @@ class CSODataset:
                 that do not correspond to dimensions in the dataset.
         """
         # Case 1: Keep all ID columns
-        if self._include_ids == IncludeIDs.ALL:
+        if self._include_ids is IncludeIDs.ALL:
             return df
 
         id_columns = [col for col in df.columns if col.endswith(ID_COLUMN_SUFFIX)]
 
         # Case 2: Keep only spatial ID column
-        if self._include_ids == IncludeIDs.SPATIAL_ONLY and self._spatial_info.key:
+        if self._include_ids is IncludeIDs.SPATIAL_ONLY and self._spatial_info.key:
             spatial_id_col = f"{self._spatial_info.key}{ID_COLUMN_SUFFIX}"
             cols_to_drop = [col for col in id_columns if col != spatial_id_col]
 
         # Case 3: Drop all ID columns
-        elif self._include_ids == IncludeIDs.NONE:
+        elif self._include_ids is IncludeIDs.NONE:
             cols_to_drop = id_columns
 
         # Case 4: Keep ID columns for specific column names
@@ -793,13 +831,14 @@ class CSODataset:
             filters={"County ID": ["IE0123"]}  # Filter by ID
             filters={"Statistic": ["Population"]}  # Filter by statistic
         """
-        if not self._filters:
+        if not self._normalised_filters:
             return df
 
-        # normalise filter keys (STATISTIC -> Statistic)
-        normalised_filters = self._normalise_filter_keys(self._filters)
-
-        for dim, values in normalised_filters.items():
+        # Masks are combined and the frame is sliced once at the end. A filter
+        # is reported as unmatched when no row satisfies it together with the
+        # filters before it, exactly as if the frame were sliced in turn.
+        combined: pd.Series | None = None
+        for dim, values in self._normalised_filters.items():
             if values is None:
                 continue
 
@@ -807,9 +846,13 @@ class CSODataset:
             value_list = list(values) if isinstance(values, (list | tuple | set)) else [values]
             value_strs = {str(v).strip() for v in value_list}
 
-            # Filter on the exact column specified
+            # Filter on the exact column specified. Matching (including the
+            # string comparison) is done on the column's unique values only,
+            # then broadcast back to rows with a single isin pass.
             if dim in df.columns:
-                mask = df[dim].isin(value_list) | df[dim].astype(str).isin(value_strs)
+                uniques = pd.Series(df[dim].unique())
+                matched = uniques[uniques.isin(value_list) | uniques.astype(str).isin(value_strs)]
+                mask = df[dim].isin(matched)
             else:
                 raise ValidationError(
                     f"Filter dimension {dim!r} not found in dataset '{self.table_code}'.",
@@ -817,13 +860,15 @@ class CSODataset:
                     value=dim,
                 )
 
-            if not mask.any():
+            combined = mask if combined is None else combined & mask
+            if not combined.any():
                 raise ValidationError(
                     f"No matching values for filter {dim}={value_list} "
                     f"in dataset '{self.table_code}'."
                 )
 
-            df = df[mask]
+        if combined is not None:
+            df = df[combined]
 
         return df.reset_index(drop=True)
 
@@ -847,17 +892,14 @@ class CSODataset:
         Returns:
             The DataFrame with filtered dimension columns removed.
         """
-        if not self._filters:
+        if not self._normalised_filters:
             return df
 
-        # Use normalised filters for consistency
-        normalised_filters = self._normalise_filter_keys(self._filters)
-
         spatial_key = self._spatial_info.key if preserve_spatial else None
         spatial_id = f"{spatial_key}{ID_COLUMN_SUFFIX}" if spatial_key else None
 
         cols_to_drop = []
-        for dim in normalised_filters:
+        for dim in self._normalised_filters:
             # Skip spatial columns if preserving
             if preserve_spatial and dim in (spatial_key, spatial_id):
                 continue
@@ -960,12 +1002,16 @@ class CSODataset:
         new_columns = {col: sanitise_string(col) for col in df.columns}
         df = df.rename(columns=new_columns)
 
-        # Step 2: Sanitise string values in dimension columns (excluding 'value')
-        for col in df.columns:
-            if col == "value":
-                continue
-            if df[col].dtype == "object":
-                df[col] = df[col].apply(lambda x: sanitise_string(x) if isinstance(x, str) else x)
+        # Step 2: Sanitise string values in dimension columns (excluding 'value').
+        # Dimension columns repeat a small set of labels, so sanitise each
+        # unique value once and map the results back onto the column.
+        string_cols = df.select_dtypes(include=["object", "string"]).columns
+        for col in string_cols.drop("value", errors="ignore"):
+            values = df[col]
+            mapping = {
+                x: sanitise_string(x) for x in values.dropna().unique() if isinstance(x, str)
+            }
+            df[col] = values.map(mapping).where(values.isin(mapping.keys()), values)
 
         return df
 
@@ -973,6 +1019,37 @@ class CSODataset:
     # Pivoting Methods
     # -------------------------------------------------------------------------
 
+    def _get_cached_pivot(
+        self,
+        source: str,
+        fmt: PivotFormat,
+        frame: pd.DataFrame,
+        pivot: Callable[[Any], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Return a pivoted frame, computing it only on first request.
+
+        Args:
+            source: Name of the cached frame being pivoted ("df", "gdf" or
+                "gdf_ungeneralised").
+            fmt: The pivot format being produced.
+            frame: The cached long-format frame to pivot.
+            pivot: The pivot method to apply on a cache miss.
+
+        Returns:
+            The cached pivoted frame (not a copy).
+        """
+        key = (source, fmt)
+        result = self._cached_pivots.get(key)
+        if result is None:
+            result = pivot(frame)
+            self._cached_pivots[key] = result
+        return result
+
+    def _clear_cached_pivots(self, source: str) -> None:
+        """Discard cached pivots derived from the given source frame."""
+        for key in [key for key in self._cached_pivots if key[0] == source]:
+            del self._cached_pivots[key]
+
     def _pivot_wide(self, df: pd.DataFrame) -> pd.DataFrame:
         """Pivot to wide format with time periods as columns.
 
@@ -1003,6 +1080,10 @@ class CSODataset:
         time_var_id = f"{time_var}{ID_COLUMN_SUFFIX}"
         index_cols = [col for col in df.columns if col not in (time_var, time_var_id, "value")]
 
+        # Exact repeats of a row carry no conflicting values, so drop them;
+        # only genuinely conflicting duplicates are rejected below
+        df = df.drop_duplicates(subset=[*index_cols, time_var, "value"])
+
         # Check for duplicates
         if df.duplicated(subset=[*index_cols, time_var]).any():
             raise ValidationError(
@@ -1012,11 +1093,10 @@ class CSODataset:
                 value="wide",
             )
 
-        # Drop time variable ID before pivoting if present
+        # Drop time variable ID before pivoting if present (returns a new frame)
         df_to_pivot = df.drop(columns=[time_var_id], errors="ignore")
 
         # Preserve original row order by creating a sort key
-        df_to_pivot = df_to_pivot.copy()
         df_to_pivot["_original_order"] = range(len(df_to_pivot))
 
         # Get the first occurrence order for each combination of index columns
@@ -1027,14 +1107,12 @@ class CSODataset:
 
         df_to_pivot = df_to_pivot.drop(columns=["_original_order"])
 
-        pivoted = df_to_pivot.pivot_table(
-            index=index_cols,
-            columns=time_var,
-            values="value",
-            aggfunc="first",  # type: ignore
-            dropna=False,
-            sort=False,
-        ).reset_index()
+        # Rows are unique per index and time period, so a plain reshape is
+        # enough; pivot_table would aggregate and, with dropna=False, expand
+        # the index to every combination of its levels
+        time_order = list(dict.fromkeys(df_to_pivot[time_var].tolist()))
+        pivoted = df_to_pivot.pivot(index=index_cols, columns=time_var, values="value")
+        pivoted = pivoted.reindex(columns=time_order).reset_index()
 
         # Merge with order and sort to restore original order
         pivoted = pivoted.merge(order_df, on=index_cols, how="left")
@@ -1073,6 +1151,10 @@ class CSODataset:
             col for col in df.columns if col not in ("Statistic", "Statistic ID", "value")
         ]
 
+        # Exact repeats of a row carry no conflicting values, so drop them;
+        # only genuinely conflicting duplicates are rejected below
+        df = df.drop_duplicates(subset=[*index_cols, "Statistic", "value"])
+
         # For duplicate checking, use the cleaned index columns
         if df.duplicated(subset=[*index_cols, "Statistic"]).any():
             raise ValidationError(
@@ -1085,11 +1167,10 @@ class CSODataset:
         # Preserve original statistic order
         stat_order = list(dict.fromkeys(df["Statistic"].tolist()))
 
-        # Drop Statistic ID before pivoting if present
+        # Drop Statistic ID before pivoting if present (returns a new frame)
         df_to_pivot = df.drop(columns=["Statistic ID"], errors="ignore")
 
         # Preserve original row order by creating a sort key
-        df_to_pivot = df_to_pivot.copy()
         df_to_pivot["_original_order"] = range(len(df_to_pivot))
 
         # Get the first occurrence order for each combination of index columns
@@ -1100,13 +1181,9 @@ class CSODataset:
 
         df_to_pivot = df_to_pivot.drop(columns=["_original_order"])
 
-        pivoted = df_to_pivot.pivot_table(
-            index=index_cols,
-            columns="Statistic",
-            values="value",
-            aggfunc="first",  # type: ignore
-            dropna=False,
-            sort=False,
+        # Rows are unique per index and statistic, so reshape without aggregating
+        pivoted = df_to_pivot.pivot(
+            index=index_cols, columns="Statistic", values="value"
         ).reset_index()
 
         # Merge with order and sort to restore original order
@@ -1135,6 +1212,8 @@ class CSODataset:
         Returns:
             The pivoted GeoDataFrame with geometry preserved.
         """
+        import geopandas as gpd
+
         geometry_col = gdf.geometry.name
         crs = gdf.crs
         spatial_key = self._spatial_info.key
@@ -1195,6 +1274,8 @@ class CSODataset:
         Returns:
             The pivoted GeoDataFrame with geometry preserved.
         """
+        import geopandas as gpd
+
         geometry_col = gdf.geometry.name
         crs = gdf.crs
         spatial_key = self._spatial_info.key
@@ -3,6 +3,12 @@
 This module handles all HTTP communication with the CSO API, including
 request caching, retry logic, and error handling.
 
+Responses are cached in memory for the lifetime of the process. Setting the
+``PYCSODATA_DISK_CACHE`` environment variable to ``1``, ``true`` or ``yes``
+additionally persists responses to disk (under ``$PYCSODATA_CACHE_DIR/http``
+if set, otherwise ``~/.pycsodata/cache/http``), so that repeat runs can skip
+the network entirely.
+
 Public Functions:
     fetch_json: Fetch JSON from a URL with caching and retries.
     load_metadata: Load dataset metadata from the CSO API.
@@ -13,12 +19,25 @@ Public Functions:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
 import threading
 import time
+from pathlib import Path
 from typing import Any
 
 import requests
 from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+
+try:  # Optional faster JSON decoder (pip install pycsodata[fast])
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
 
 from pycsodata.constants import (
     CACHE_TTL_SECONDS,
@@ -30,6 +49,8 @@ from pycsodata.constants import (
 from pycsodata.exceptions import APIError
 from pycsodata.parsers import repair_json
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Cache Management
 # =============================================================================
@@ -50,12 +71,20 @@ def flush_cache() -> None:
     Useful when you know data has been updated or during testing.
 
     Note:
-        This also resets the cache hit/miss statistics.
+        This also resets the cache hit/miss statistics, removes any
+        responses persisted to the disk cache and drops the boundary
+        GeoDataFrames built from cached spatial responses.
     """
     with _cache_lock:
         _http_cache.clear()
         _cache_stats["hits"] = 0
         _cache_stats["misses"] = 0
+    # File I/O happens outside the lock so concurrent lookups are not blocked
+    _disk_cache_clear()
+    # Only clear boundaries if spatial support was loaded; never import it here
+    spatial = sys.modules.get("pycsodata.spatial")
+    if spatial is not None:
+        spatial._clear_boundary_cache()
 
 
 def get_cache_info() -> dict[str, Any]:
@@ -63,17 +92,155 @@ def get_cache_info() -> dict[str, Any]:
 
     Returns:
         A dictionary with cache statistics including size, maxsize, TTL,
-        and hit rate.
+        hit rate, and the number of responses persisted to disk.
     """
+    # Only snapshot the shared state under the lock; derive the rest outside it
     with _cache_lock:
-        total_requests = _cache_stats["hits"] + _cache_stats["misses"]
-        hit_rate = _cache_stats["hits"] / total_requests if total_requests > 0 else None
-        return {
-            "size": len(_http_cache),
-            "maxsize": _http_cache.maxsize,
-            "ttl_seconds": _http_cache.ttl,
-            "hit_rate": hit_rate,
-        }
+        hits = _cache_stats["hits"]
+        misses = _cache_stats["misses"]
+        size = len(_http_cache)
+
+    total_requests = hits + misses
+    return {
+        "size": size,
+        "maxsize": _http_cache.maxsize,
+        "ttl_seconds": _http_cache.ttl,
+        "hit_rate": hits / total_requests if total_requests > 0 else None,
+        "disk_size": _disk_cache_size(),
+    }
+
+
+# =============================================================================
+# Persistent Disk Cache
+# =============================================================================
+
+
+def _get_disk_cache_dir() -> Path | None:
+    """Get the directory for persisted HTTP responses.
+
+    The disk cache is opt-in and is only enabled when the
+    ``PYCSODATA_DISK_CACHE`` environment variable is set to ``1``, ``true``
+    or ``yes``. Uses an ``http`` subdirectory of ``PYCSODATA_CACHE_DIR`` if
+    set, otherwise falls back to ``~/.pycsodata/cache/http``.
+
+    Returns:
+        Path to the cache directory, or None if the disk cache is disabled.
+    """
+    if os.environ.get("PYCSODATA_DISK_CACHE", "").strip().lower() not in ("1", "true", "yes"):
+        return None
+    env_dir = os.environ.get("PYCSODATA_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir) / "http"
+    return Path.home() / ".pycsodata" / "cache" / "http"
+
+
+def _disk_cache_path(cache_dir: Path, cache_key: str) -> Path:
+    """Get the file path for a cache key within the disk cache directory."""
+    return cache_dir / f"{hashlib.sha256(cache_key.encode()).hexdigest()[:32]}.json"
+
+
+def _disk_cache_get(cache_key: str) -> dict[str, Any] | None:
+    """Read a response from the disk cache if present and not expired.
+
+    Args:
+        cache_key: The normalised cache key for the request.
+
+    Returns:
+        The cached JSON response, or None on a miss.
+    """
+    cache_dir = _get_disk_cache_dir()
+    if cache_dir is None:
+        return None
+
+    path = _disk_cache_path(cache_dir, cache_key)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        result: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return result
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Failed to read cached response from %s: %s", path, e)
+        return None
+
+
+def _disk_cache_set(cache_key: str, data: dict[str, Any]) -> None:
+    """Persist a response to the disk cache.
+
+    The file is written to a temporary path and then moved into place, so
+    that concurrent readers never see a partially written response.
+
+    Args:
+        cache_key: The normalised cache key for the request.
+        data: The JSON response to persist.
+    """
+    cache_dir = _get_disk_cache_dir()
+    if cache_dir is None:
+        return
+
+    path = _disk_cache_path(cache_dir, cache_key)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Failed to cache response to %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _disk_cache_clear() -> None:
+    """Remove all persisted responses from the disk cache."""
+    cache_dir = _get_disk_cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return
+    for path in cache_dir.glob("*.json"):
+        path.unlink(missing_ok=True)
+
+
+def _disk_cache_size() -> int:
+    """Count the responses persisted to the disk cache."""
+    cache_dir = _get_disk_cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return 0
+    return sum(1 for _ in cache_dir.glob("*.json"))
+
+
+# =============================================================================
+# HTTP Session
+# =============================================================================
+
+# Connection pool sizing for the shared session
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 16
+
+
+def _create_session() -> requests.Session:
+    """Create a requests session with connection pooling.
+
+    Reusing one session keeps TCP/TLS connections to the CSO API alive
+    between the metadata, dataset and boundary requests. Retries are left
+    to :func:`_fetch_json_impl` so that client errors fail fast and every
+    failure is reported as an :class:`APIError`.
+
+    Returns:
+        A configured :class:`requests.Session`.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        max_retries=0,
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session used for all CSO API requests
+_session = _create_session()
 
 
 # =============================================================================
@@ -108,6 +275,8 @@ def fetch_json(
 
     This is the main entry point for HTTP requests. It automatically
     caches responses (with TTL-based expiration) and retries failed requests.
+    If the disk cache is enabled, responses are also persisted across
+    processes.
 
     Args:
         url: The URL to fetch.
@@ -129,6 +298,14 @@ def fetch_json(
                 _cache_stats["hits"] += 1
                 return _http_cache[cache_key]
 
+        # Fall back to the persistent cache, promoting hits into memory
+        disk_result = _disk_cache_get(cache_key)
+        if disk_result is not None:
+            with _cache_lock:
+                _cache_stats["hits"] += 1
+                _http_cache[cache_key] = disk_result
+            return disk_result
+
     # Fetch from network
     result = _fetch_json_impl(url, params=params)
 
@@ -136,10 +313,56 @@ def fetch_json(
         with _cache_lock:
             _cache_stats["misses"] += 1
             _http_cache[cache_key] = result
+        _disk_cache_set(cache_key, result)
 
     return result
 
 
+# Retry delays (seconds) before attempts 2, 3, ...: 0.5, 1, 2, 4, ... doubling
+# up to a cap, precomputed so the error path only needs a lookup
+_BACKOFF_DELAYS: tuple[float, ...] = tuple(RETRY_DELAY_MULTIPLIER * 2**i for i in range(8))
+
+# Relative jitter applied to each delay so concurrent clients do not retry in lockstep
+_BACKOFF_JITTER = 0.2
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered delay to wait after a failed attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed.
+
+    Returns:
+        The number of seconds to sleep before the next attempt.
+    """
+    delay = _BACKOFF_DELAYS[min(attempt, len(_BACKOFF_DELAYS) - 1)]
+    return delay * random.uniform(1 - _BACKOFF_JITTER, 1 + _BACKOFF_JITTER)  # nosec B311
+
+
+def _decode_json(response: requests.Response) -> dict[str, Any]:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Falls back to ``response.json()`` when orjson is unavailable or cannot
+    decode the body, so that malformed responses raise the same
+    :class:`requests.exceptions.JSONDecodeError` either way.
+
+    Args:
+        response: The HTTP response to decode.
+
+    Returns:
+        The parsed JSON response as a dictionary.
+    """
+    content = response.content
+    if orjson is not None and isinstance(content, bytes):
+        try:
+            result: dict[str, Any] = orjson.loads(content)
+            return result
+        except orjson.JSONDecodeError:
+            pass
+    result = response.json()
+    return result
+
+
 def _fetch_json_impl(
     url: str,
     *,
@@ -168,10 +391,9 @@ def _fetch_json_impl(
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = _session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
-            return result
+            return _decode_json(response)
         except requests.exceptions.Timeout as e:
             last_error = e
         except requests.exceptions.ConnectionError as e:
@@ -188,9 +410,9 @@ def _fetch_json_impl(
         except requests.exceptions.RequestException as e:
             last_error = e
 
-        # Exponential backoff between retries
+        # Exponential backoff (with jitter) between retries
         if attempt < retries - 1:
-            time.sleep(RETRY_DELAY_MULTIPLIER * (attempt + 1))
+            time.sleep(_backoff_delay(attempt))
 
     raise APIError(
         f"Request to {url} failed after {retries} attempts: {last_error}",
@@ -202,6 +424,14 @@ def _fetch_json_impl(
 # CSO API-Specific Functions
 # =============================================================================
 
+# Message for 404 responses, which the CSO API returns for unknown table codes.
+# Client errors are never retried, so this is formatted once per failed load.
+_TABLE_NOT_FOUND_MESSAGE = (
+    "Dataset '{table_code}' not found. The table code does not correspond "
+    "to a valid CSO dataset. Please check the table code and try again. "
+    "You can use CSOCatalogue().search() to find available datasets."
+)
+
 
 def load_metadata(table_code: str, *, cache: bool = True) -> dict[str, Any]:
     """Load dataset metadata from the CSO RESTful API.
@@ -225,9 +455,7 @@ def load_metadata(table_code: str, *, cache: bool = True) -> dict[str, Any]:
         # Provide a more helpful error message for 404 errors (invalid table code)
         if e.status_code == 404:
             raise APIError(
-                f"Dataset '{table_code}' not found. The table code does not correspond "
-                f"to a valid CSO dataset. Please check the table code and try again. "
-                f"You can use CSOCatalogue().search() to find available datasets.",
+                _TABLE_NOT_FOUND_MESSAGE.format(table_code=table_code),
                 url=url,
                 status_code=404,
             ) from e
@@ -258,9 +486,7 @@ def load_dataset(table_code: str, *, cache: bool = True) -> dict[str, Any]:
         # Provide a more helpful error message for 404 errors (invalid table code)
         if e.status_code == 404:
             raise APIError(
-                f"Dataset '{table_code}' not found. The table code does not correspond "
-                f"to a valid CSO dataset. Please check the table code and try again. "
-                f"You can use CSOCatalogue().search() to find available datasets.",
+                _TABLE_NOT_FOUND_MESSAGE.format(table_code=table_code),
                 url=url,
                 status_code=404,
             ) from e
@@ -6,22 +6,52 @@ temporal column processing.
 
 Public Functions:
     repair_text: Fix incorrectly encoded Irish characters.
-    repair_json: Recursively repair encoding in JSON structures.
+    repair_json: Repair encoding throughout a JSON structure.
     extract_spatial_info: Extract spatial configuration from metadata.
     extract_id_mapping: Create label-to-ID mapping for a dimension.
     parse_metadata: Parse raw API metadata into structured format.
     parse_temporal_column: Convert temporal columns to appropriate types.
+    json_stat_to_dataframe: Decode a JSON-stat dataset into a DataFrame.
 """
 
 from __future__ import annotations
 
+import math
 import re
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from pycsodata._types import DatasetMetadata, SpatialInfo
-from pycsodata.constants import MISENCODED_CHARACTER_MAP, STATISTIC_LABELS
+from pycsodata.constants import MISENCODED_CHARACTER_MAP
+
+# Patterns used while parsing time columns and notes, compiled once at import.
+_YEAR_PATTERN = re.compile(r"^\d{4}$")
+_YEAR_MONTH_PATTERN = re.compile(r"^\d{4}M\d{2}$")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_FORMAT_TAG_PATTERN = re.compile(r"\[/?[ib]\]")
+_URL_TAG_PATTERN = re.compile(r"\s*\[url=(.*?)\](.*?)\[/url\]\s*")
+
+# Translation table for repair_text; every misencoding is a single character
+_REPAIR_TABLE = str.maketrans(MISENCODED_CHARACTER_MAP)
+
+# Statistic dimension names in lookup order. STATISTIC_LABELS is a frozenset,
+# whose iteration order varies between interpreter runs.
+_STATISTIC_DIMENSION_KEYS: tuple[str, ...] = ("STATISTIC", "Statistic")
+
+# Time labels (matched as lowercase substrings) whose values are left unparsed
+_SKIPPED_TIME_LABELS: tuple[str, ...] = ("influenza season", "academic year", "halfyear")
+
+# Extension flags reported as dataset tags, in display order
+_EXTENSION_TAG_LABELS: tuple[tuple[str, str], ...] = (
+    ("experimental", "Experimental Statistics"),
+    ("reservation", "Reservation Statistics"),
+    ("archive", "Archive Statistics"),
+    ("analytical", "Analytical Statistics"),
+    ("official", "Official Statistics"),
+)
 
 # =============================================================================
 # Text Repair Functions
@@ -44,16 +74,20 @@ def repair_text(text: str) -> str:
         >>> repair_text("┴ras an Uachtarßin")
         'Áras an Uachtaráin'
     """
-    for bad_char, good_char in MISENCODED_CHARACTER_MAP.items():
-        text = text.replace(bad_char, good_char)
-    return text
+    # All misencoded characters are non-ASCII, so ASCII text needs no repair
+    if text.isascii():
+        return text
+    return text.translate(_REPAIR_TABLE)
 
 
 def repair_json(obj: Any) -> Any:
-    """Recursively repair encoding issues in a JSON-like structure.
+    """Repair encoding issues throughout a JSON-like structure.
 
     Traverses dictionaries, lists, and strings, applying character
-    encoding fixes throughout.
+    encoding fixes throughout. The traversal uses an explicit stack, so
+    deeply nested structures do not hit the recursion limit. Containers
+    are copied rather than modified, leaving the input (which may be a
+    cached response) untouched.
 
     Args:
         obj: A JSON-like object (dict, list, str, or primitive).
@@ -65,13 +99,30 @@ def repair_json(obj: Any) -> Any:
         >>> repair_json({"name": "╔ire", "values": ["Θire"]})
         {'name': 'Éire', 'values': ['éire']}
     """
-    if isinstance(obj, dict):
-        return {key: repair_json(value) for key, value in obj.items()}
-    if isinstance(obj, list):
-        return [repair_json(item) for item in obj]
     if isinstance(obj, str):
         return repair_text(obj)
-    return obj
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root = dict(obj) if isinstance(obj, dict) else list(obj)
+    stack: list[dict[str, Any] | list[Any]] = [root]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        # Only existing keys/indices are reassigned, so iterating while
+        # writing back is safe
+        for key, value in items:
+            if isinstance(value, str):
+                container[key] = repair_text(value)  # type: ignore[index]
+            elif isinstance(value, dict):
+                child: dict[str, Any] | list[Any] = dict(value)
+                container[key] = child  # type: ignore[index]
+                stack.append(child)
+            elif isinstance(value, list):
+                child = list(value)
+                container[key] = child  # type: ignore[index]
+                stack.append(child)
+    return root
 
 
 # =============================================================================
@@ -230,57 +281,130 @@ def parse_temporal_column(
         return df
 
     sample_value = str(df[time_variable].iloc[0])
-    time_label_lower = time_variable.lower()
+    time_format = _detect_time_format(time_variable, sample_value)
+    column = df[time_variable]
+
+    if time_format == "year":
+        # Parse the numbers directly rather than going through datetimes
+        # only to extract the year again. to_numeric also accepts values such
+        # as "2019.5" or "1e3", so anything not four digits becomes NaN first.
+        is_year = column.astype("string").str.fullmatch(_YEAR_PATTERN.pattern, na=False)
+        df[time_variable] = pd.to_numeric(column.where(is_year), errors="coerce")
+    elif time_format == "month_code":
+        parsed = pd.to_datetime(column, format="%YM%m", errors="coerce")
+        df[time_variable] = parsed.dt.to_period("M")
+    elif time_format == "month":
+        parsed = pd.to_datetime(column, format="mixed", errors="coerce")
+        df[time_variable] = parsed.dt.to_period("M")
+    elif time_format == "quarter":
+        parsed = pd.to_datetime(column, format="mixed", errors="coerce")
+        df[time_variable] = parsed.dt.to_period("Q")
+    elif time_format == "week":
+        df[time_variable] = pd.to_datetime(column, format="mixed", errors="coerce").dt.date
+    elif time_format == "datetime":
+        try:
+            parsed = pd.to_datetime(column, format="mixed", errors="coerce")
+            # If all times are midnight, convert to date only
+            if pd.api.types.is_datetime64_any_dtype(parsed):
+                if (parsed.dt.time == pd.Timestamp("00:00:00").time()).all():
+                    df[time_variable] = parsed.dt.date
+                else:
+                    df[time_variable] = parsed
+        except (ValueError, TypeError, AttributeError):
+            # Parsing failed - leave the column as-is
+            pass
+
+    return df
+
 
+@lru_cache(maxsize=256)
+def _detect_time_format(time_variable: str, sample_value: str) -> str:
+    """Classify a time column from its label and first value.
+
+    Detection depends only on these two strings, so results are memoised;
+    CSO tables reuse a small set of time labels and formats.
+
+    Args:
+        time_variable: The name of the time column.
+        sample_value: The first value in the column, as a string.
+
+    Returns:
+        One of "year", "month_code", "month", "quarter", "week", "skip"
+        or "datetime".
+    """
     # Year only (e.g., "2022")
-    if re.match(r"^\d{4}$", sample_value):
-        df[time_variable] = pd.to_datetime(df[time_variable], format="%Y", errors="coerce").dt.year
-        return df
+    if _YEAR_PATTERN.match(sample_value):
+        return "year"
+
+    time_label_lower = time_variable.lower()
 
     # Monthly data (e.g., "2022M01")
     if "month" in time_label_lower:
-        if re.match(r"^\d{4}M\d{2}$", sample_value):
-            df[time_variable] = pd.to_datetime(
-                df[time_variable], format="%YM%m", errors="coerce"
-            ).dt.to_period("M")
-        else:
-            df[time_variable] = pd.to_datetime(
-                df[time_variable], format="mixed", errors="coerce"
-            ).dt.to_period("M")
-        return df
+        return "month_code" if _YEAR_MONTH_PATTERN.match(sample_value) else "month"
 
-    # Quarterly data
     if "quarter" in time_label_lower:
-        df[time_variable] = pd.to_datetime(
-            df[time_variable], format="mixed", errors="coerce"
-        ).dt.to_period("Q")
-        return df
+        return "quarter"
 
-    # Weekly data
     if "week" in time_label_lower:
-        df[time_variable] = pd.to_datetime(
-            df[time_variable], format="mixed", errors="coerce"
-        ).dt.date
-        return df
+        return "week"
 
     # Skip non-standard time formats
-    skip_patterns = ("influenza season", "academic year", "halfyear")
-    if any(pattern in time_label_lower for pattern in skip_patterns):
-        return df
+    if any(pattern in time_label_lower for pattern in _SKIPPED_TIME_LABELS):
+        return "skip"
 
     # Default: try to parse as datetime
-    try:
-        parsed = pd.to_datetime(df[time_variable], format="mixed", errors="coerce")
-        # If all times are midnight, convert to date only
-        if pd.api.types.is_datetime64_any_dtype(parsed):
-            if (parsed.dt.time == pd.Timestamp("00:00:00").time()).all():
-                df[time_variable] = parsed.dt.date
-            else:
-                df[time_variable] = parsed
-    except (ValueError, TypeError, AttributeError):
-        # Parsing failed - leave the column as-is
-        pass
+    return "datetime"
+
+
+# =============================================================================
+# JSON-stat Decoding
+# =============================================================================
+
+
+def json_stat_to_dataframe(dataset: dict[str, Any]) -> pd.DataFrame:
+    """Decode a JSON-stat 2.0 dataset into a long-format DataFrame.
+
+    Each dimension becomes a column of category labels, named after the
+    dimension label, followed by a ``value`` column. JSON-stat stores values
+    in row-major order over the Cartesian product of the dimension
+    categories, so each label column is built by repeating and tiling that
+    dimension's labels with NumPy rather than enumerating rows in Python.
+
+    Args:
+        dataset: A JSON-stat 2.0 response with class "dataset".
+
+    Returns:
+        A DataFrame with one column per dimension plus a ``value`` column.
 
+    Raises:
+        ValueError: If the number of values does not match the dimension sizes.
+    """
+    dimensions = dataset["dimension"]
+    # JSON-stat 2.0 lists dimension IDs at the top level; 1.0 nests them
+    dimension_ids = dataset["id"] if "id" in dataset else dimensions["id"]
+
+    names: list[str] = []
+    labels: list[np.ndarray] = []
+    for dim_id in dimension_ids:
+        dim = dimensions[dim_id]
+        names.append(dim.get("label") or dim_id)
+        labels.append(_category_labels(dim.get("category", {})))
+
+    sizes = [len(dim_labels) for dim_labels in labels]
+    total = math.prod(sizes)
+    values = _dense_values(dataset.get("value", []), total)
+
+    columns: dict[int, Any] = {}
+    for position, dim_labels in enumerate(labels):
+        inner = math.prod(sizes[position + 1 :])
+        outer = math.prod(sizes[:position])
+        columns[position] = np.tile(np.repeat(dim_labels, inner), outer)
+    columns[len(labels)] = values
+
+    # Build with positional keys, then name the columns, so that dimensions
+    # sharing a label are kept as separate columns
+    df = pd.DataFrame(columns)
+    df.columns = [*names, "value"]
     return df
 
 
@@ -289,6 +413,58 @@ def parse_temporal_column(
 # =============================================================================
 
 
+def _category_labels(category: dict[str, Any]) -> np.ndarray:
+    """Get the labels of a JSON-stat dimension's categories in index order.
+
+    Args:
+        category: The "category" object of a JSON-stat dimension.
+
+    Returns:
+        An object array of category labels. Categories without a label
+        fall back to their ID.
+    """
+    index = category.get("index")
+    label = category.get("label", {})
+
+    if isinstance(index, dict):
+        ids = sorted(index, key=index.__getitem__)
+    elif isinstance(index, list):
+        ids = index
+    else:
+        # The index may only be omitted for single-category dimensions
+        ids = list(label)
+
+    return np.array([label.get(cat_id, cat_id) for cat_id in ids], dtype=object)
+
+
+def _dense_values(values: list[Any] | dict[str, Any], total: int) -> list[Any]:
+    """Expand JSON-stat values into a dense list of observations.
+
+    Args:
+        values: The "value" member, either a dense list or a sparse mapping
+            of string positions to values.
+        total: The number of observations implied by the dimension sizes.
+
+    Returns:
+        A list of length ``total``, with None for missing sparse values.
+
+    Raises:
+        ValueError: If a dense list does not have ``total`` entries.
+    """
+    if isinstance(values, dict):
+        dense: list[Any] = [None] * total
+        for position, value in values.items():
+            dense[int(position)] = value
+        return dense
+
+    if len(values) != total:
+        raise ValueError(
+            f"JSON-stat dataset has {len(values)} values but its dimensions "
+            f"describe {total} observations."
+        )
+    return values
+
+
 def _get_statistic_dimension(dimensions: dict[str, Any]) -> dict[str, Any]:
     """Get the statistic dimension from the dimensions dict.
 
@@ -302,9 +478,9 @@ def _get_statistic_dimension(dimensions: dict[str, Any]) -> dict[str, Any]:
     Returns:
         The statistic dimension dictionary, or an empty dict if not found.
     """
-    for label in STATISTIC_LABELS:
-        if label in dimensions:
-            result = dimensions[label]
+    for label in _STATISTIC_DIMENSION_KEYS:
+        result = dimensions.get(label)
+        if result is not None:
             return result if isinstance(result, dict) else {}
     return {}
 
@@ -319,7 +495,7 @@ def _extract_units(statistic_dim: dict[str, Any]) -> list[str]:
         A list of unit labels (e.g., ["Persons", "Percentage"]).
     """
     unit_info = statistic_dim.get("category", {}).get("unit", {})
-    return [info.get("label") for info in unit_info.values() if info.get("label")]
+    return [label for info in unit_info.values() if (label := info.get("label"))]
 
 
 def _extract_time_variable(
@@ -345,6 +521,13 @@ def _extract_time_variable(
     return None
 
 
+def _format_url_tag(match: re.Match[str]) -> str:
+    """Render a [url=...]text[/url] match as "text (url)"."""
+    url = match.group(1).strip()
+    text = match.group(2).strip()
+    return f" {text} ({url}) "
+
+
 def _process_notes(notes: list[str]) -> list[str]:
     """Clean and format notes from metadata.
 
@@ -362,20 +545,13 @@ def _process_notes(notes: list[str]) -> list[str]:
         if not note:
             continue
 
-        # Remove formatting tags and normalise whitespace
-        cleaned = note.strip()
-        cleaned = cleaned.replace("[i]", "").replace("[/i]", "")
-        cleaned = cleaned.replace("\n", " ")
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        cleaned = cleaned.replace("[b]", "").replace("[/b]", "")
+        # Remove [i]/[b] formatting tags, then collapse whitespace (including
+        # newlines) to single spaces
+        cleaned = _FORMAT_TAG_PATTERN.sub("", note)
+        cleaned = _WHITESPACE_PATTERN.sub(" ", cleaned).strip()
 
         # Convert [url=...] tags to readable format
-        def replace_url(match: re.Match[str]) -> str:
-            url = match.group(1).strip()
-            text = match.group(2).strip()
-            return f" {text} ({url}) "
-
-        cleaned = re.sub(r"\s*\[url=(.*?)\](.*?)\[/url\]\s*", replace_url, cleaned)
+        cleaned = _URL_TAG_PATTERN.sub(_format_url_tag, cleaned)
         processed.append(cleaned)
 
     return processed
@@ -394,19 +570,7 @@ def _build_tags(extension: dict[str, Any], has_spatial: bool) -> list[str]:
     Returns:
         A list of tag strings (e.g., ["Official Statistics", "Geographic Data"]).
     """
-    tags = []
-
-    tag_mapping = [
-        ("experimental", "Experimental Statistics"),
-        ("reservation", "Reservation Statistics"),
-        ("archive", "Archive Statistics"),
-        ("analytical", "Analytical Statistics"),
-        ("official", "Official Statistics"),
-    ]
-
-    for key, label in tag_mapping:
-        if extension.get(key, False):
-            tags.append(label)
+    tags = [label for key, label in _EXTENSION_TAG_LABELS if extension.get(key, False)]
 
     if has_spatial:
         tags.append("Geographic Data")
@@ -18,6 +18,8 @@ import textwrap
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import TextIO
+
     from pycsodata._types import DatasetMetadata, FilterSpec
 
 
@@ -31,6 +33,7 @@ class MetadataPrinter:
         metadata: The structured metadata dictionary for the dataset.
         filters: Optional filters that were applied to the dataset.
         drop_filtered_cols: Whether filtered columns are being dropped.
+        file: Text stream to write to. Defaults to the current sys.stdout.
     """
 
     WIDTH = 85
@@ -41,11 +44,14 @@ class MetadataPrinter:
         metadata: DatasetMetadata,
         filters: FilterSpec | None = None,
         drop_filtered_cols: bool = False,
+        *,
+        file: TextIO | None = None,
     ) -> None:
         self.meta = metadata
         # normalise filter keys (STATISTIC -> Statistic)
         self.filters = self._normalise_filter_keys(filters) if filters else {}
         self.drop_filtered_cols = drop_filtered_cols
+        self.file = file
 
     @staticmethod
     def _normalise_filter_keys(filters: FilterSpec) -> FilterSpec:
@@ -92,7 +98,7 @@ class MetadataPrinter:
         if title:
             self._print_line("Title:", title)
 
-        print()
+        print(file=self.file)
 
     def _print_variables(self) -> None:
         """Print variables, statistics, and their units."""
@@ -118,48 +124,53 @@ class MetadataPrinter:
         for i, var in enumerate(variables, start=1):
             if str(var).upper() == "STATISTIC" and statistics:
                 if i == 1:
-                    print(f"{'Variables:':<{self.LABEL_WIDTH}} [{i}] Statistic")
+                    print(f"{'Variables:':<{self.LABEL_WIDTH}} [{i}] Statistic", file=self.file)
                 else:
-                    print(f"{'':<{self.LABEL_WIDTH}} [{i}] Statistic")
+                    print(f"{'':<{self.LABEL_WIDTH}} [{i}] Statistic", file=self.file)
                 for j, stat in enumerate(statistics, start=1):
-                    print(f"{'':<24}({j}) {stat}")
+                    print(f"{'':<24}({j}) {stat}", file=self.file)
                     unit = units[j - 1] if j - 1 < len(units) else "N/A"
-                    print(f"{'':<28}Unit: {unit}")
+                    print(f"{'':<28}Unit: {unit}", file=self.file)
             else:
                 label = "Variables:" if i == 1 else ""
-                print(f"{label:<{self.LABEL_WIDTH}} [{i}] {var}")
+                print(f"{label:<{self.LABEL_WIDTH}} [{i}] {var}", file=self.file)
 
-        print()
+        print(file=self.file)
 
     def _print_tags(self) -> None:
         """Print dataset classification tags."""
         tags = self.meta.get("tags", [])
         tag_str = ", ".join(tags) if tags else "None"
-        print(f"{'Tags:':<{self.LABEL_WIDTH}} {tag_str}")
+        print(f"{'Tags:':<{self.LABEL_WIDTH}} {tag_str}", file=self.file)
 
     def _print_time_and_spatial(self) -> None:
         """Print time variable and geographic variable information."""
         time_var = self.meta.get("time_variable")
         if time_var:
-            print(f"{'Time Variable:':<{self.LABEL_WIDTH}} {time_var}")
+            print(f"{'Time Variable:':<{self.LABEL_WIDTH}} {time_var}", file=self.file)
 
         if self.meta.get("geographic"):
             spatial_key = self.meta.get("spatial_key")
-            print(f"{'Geographic Variable:':<{self.LABEL_WIDTH}} {spatial_key}")
+            print(f"{'Geographic Variable:':<{self.LABEL_WIDTH}} {spatial_key}", file=self.file)
 
-        print()
+        print(file=self.file)
 
     def _print_updated(self) -> None:
         """Print the last updated date and reason for release."""
         updated = self.meta.get("last_updated")
         if updated:
-            print(f"{'Last Updated:':<{self.LABEL_WIDTH}} {updated.strftime('%Y-%m-%d')}")
+            print(
+                f"{'Last Updated:':<{self.LABEL_WIDTH}} {updated.strftime('%Y-%m-%d')}",
+                file=self.file,
+            )
 
         reasons = self.meta.get("reasons", [])
         if reasons:
-            print(f"{'Reason for Release:':<{self.LABEL_WIDTH}} {', '.join(reasons)}")
+            print(
+                f"{'Reason for Release:':<{self.LABEL_WIDTH}} {', '.join(reasons)}", file=self.file
+            )
 
-        print()
+        print(file=self.file)
 
     def _print_notes(self) -> None:
         """Print dataset notes with text wrapping."""
@@ -174,7 +185,7 @@ class MetadataPrinter:
                 else " " * (self.LABEL_WIDTH - 1),
             )
         if notes:
-            print()
+            print(file=self.file)
 
     def _print_contact(self) -> None:
         """Print contact name, email, and phone number."""
@@ -183,11 +194,11 @@ class MetadataPrinter:
         contact_phone = self.meta.get("contact_phone")
 
         if contact_name:
-            print(f"{'Contact Name:':<{self.LABEL_WIDTH}} {contact_name}")
+            print(f"{'Contact Name:':<{self.LABEL_WIDTH}} {contact_name}", file=self.file)
         if contact_email:
-            print(f"{'Contact Email:':<{self.LABEL_WIDTH}} {contact_email}")
+            print(f"{'Contact Email:':<{self.LABEL_WIDTH}} {contact_email}", file=self.file)
         if contact_phone:
-            print(f"{'Contact Phone:':<{self.LABEL_WIDTH}} {contact_phone}")
+            print(f"{'Contact Phone:':<{self.LABEL_WIDTH}} {contact_phone}", file=self.file)
 
     def _print_copyright(self) -> None:
         """Print copyright name and URL."""
@@ -196,10 +207,10 @@ class MetadataPrinter:
 
         if name:
             if href:
-                print(f"{'Copyright:':<{self.LABEL_WIDTH}} {name} ({href})")
+                print(f"{'Copyright:':<{self.LABEL_WIDTH}} {name} ({href})", file=self.file)
             else:
-                print(f"{'Copyright:':<{self.LABEL_WIDTH}} {name}")
-            print()
+                print(f"{'Copyright:':<{self.LABEL_WIDTH}} {name}", file=self.file)
+            print(file=self.file)
 
     def _print_line(self, label: str, value: str) -> None:
         """Print a single labelled line with consistent formatting.
@@ -208,7 +219,7 @@ class MetadataPrinter:
             label: The label text (e.g., "Code:").
             value: The value to display.
         """
-        print(f"{label:<{self.LABEL_WIDTH}} {value}")
+        print(f"{label:<{self.LABEL_WIDTH}} {value}", file=self.file)
 
     def _print_wrapped(self, text: str, initial_indent: str) -> None:
         """Print wrapped text with indentation.
@@ -224,4 +235,4 @@ class MetadataPrinter:
             break_long_words=False,
             break_on_hyphens=False,
         )
-        print(wrapper.fill(text))
+        print(wrapper.fill(text), file=self.file)
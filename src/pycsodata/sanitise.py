@@ -23,10 +23,15 @@ Examples:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from pycsodata.constants import SANITISATION_DICT
 
+# Precompiled patterns used by sanitise_string
+_SLASH_PATTERN = re.compile(r"\s*/\s*")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def sanitise_string(value: str) -> str:
     """Sanitise a single string value.
@@ -53,15 +58,29 @@ def sanitise_string(value: str) -> str:
     """
     if not isinstance(value, str):
         return value
+    # SANITISATION_DICT keys are already clean, so an exact key maps directly
+    # without the substitution steps
+    mapped = SANITISATION_DICT.get(value)
+    if mapped is not None:
+        return mapped
+    return _sanitise_str(value)
+
+
+@lru_cache(maxsize=4096)
+def _sanitise_str(value: str) -> str:
+    """Apply the sanitise_string transformations to a string.
 
+    The transformation is deterministic and CSO labels repeat heavily across
+    columns, metadata and datasets, so results are memoised.
+    """
     # Step 1: Replace '&' with 'and'
     result = value.replace("&", "and")
 
     # Step 2: Replace ' / ' or ' /' with '/'
-    result = re.sub(r"\s*/\s*", "/", result)
+    result = _SLASH_PATTERN.sub("/", result)
 
     # Step 3: Replace multiple spaces with single spaces
-    result = re.sub(r"\s+", " ", result)
+    result = _WHITESPACE_PATTERN.sub(" ", result)
 
     # Step 4: Strip edge whitespace
     result = result.strip()
@@ -92,7 +111,7 @@ def sanitise_list(values: list[str]) -> list[str]:
         >>> sanitise_list(["Counties", "NUTS 3 Regions"])
         ['County', 'NUTS 3 Region']
     """
-    return [sanitise_string(v) if isinstance(v, str) else v for v in values]
+    return [sanitise_string(v) for v in values]
 
 
 def sanitise_dict_keys(d: dict[str, Any]) -> dict[str, Any]:
@@ -116,28 +135,35 @@ def sanitise_dict_keys(d: dict[str, Any]) -> dict[str, Any]:
 def sanitise_dict_values(d: dict[str, Any]) -> dict[str, Any]:
     """Sanitise string values in a dictionary (not recursively).
 
-    Creates a new dictionary with sanitised string values. Lists of
-    strings are also sanitised. Non-string values are preserved unchanged.
+    String values and lists of strings are sanitised. Non-string values are
+    preserved unchanged. When no value changes, the input dictionary itself
+    is returned rather than a copy.
 
     Args:
         d: Dictionary with potentially string values.
 
     Returns:
-        New dictionary with sanitised string values.
+        Dictionary with sanitised string values.
 
     Examples:
         >>> sanitise_dict_values({"name": "Counties", "count": 32})
         {'name': 'County', 'count': 32}
     """
-    result: dict[str, Any] = {}
-    for k, v in d.items():
-        if isinstance(v, str):
-            result[k] = sanitise_string(v)
-        elif isinstance(v, list):
-            result[k] = sanitise_list(v)
-        else:
-            result[k] = v
-    return result
+    changes = {k: new for k, v in d.items() if (new := _maybe_sanitise(v)) is not v}
+    if not changes:
+        return d
+    return {**d, **changes}
+
+
+def _maybe_sanitise(value: Any) -> Any:
+    """Sanitise a string or list of strings, returning value itself if unchanged."""
+    if isinstance(value, str):
+        result: Any = sanitise_string(value)
+    elif isinstance(value, list):
+        result = sanitise_list(value)
+    else:
+        return value
+    return value if result == value else result
 
 
 def create_sanitisation_mapping(original_names: list[str]) -> dict[str, str]:
@@ -175,4 +201,5 @@ def create_reverse_mapping(original_names: list[str]) -> dict[str, str]:
         >>> create_reverse_mapping(["Counties", "NUTS 3 Regions"])
         {'County': 'Counties', 'NUTS 3 Region': 'NUTS 3 Regions'}
     """
-    return {sanitise_string(name): name for name in original_names}
+    forward = create_sanitisation_mapping(original_names)
+    return {sanitised: name for name, sanitised in forward.items()}
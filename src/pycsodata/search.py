@@ -7,8 +7,10 @@ matching (for variables) and string matching (for titles).
 Public Functions:
     parse_search_expression: Parse expression for list matching.
     parse_string_search_expression: Parse expression for string matching.
+    parse_single_term: Extract the term of a single-term query.
     extract_search_terms: Extract positive search terms from a query.
     count_matching_terms: Count how many search terms match a text.
+    count_matching_terms_series: Count matching search terms for each text in a Series.
     parse_date_input: Parse flexible date formats.
     parse_date_range_tuple: Parse date range tuples.
     date_in_date_range: Check if a date falls within a range.
@@ -25,7 +27,9 @@ Examples:
 from __future__ import annotations
 
 import re
+from calendar import monthrange
 from datetime import date
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -37,7 +41,24 @@ if TYPE_CHECKING:
 # Boolean Search Expression Parser (for list matching)
 # =============================================================================
 
+# One token per match: a quoted phrase (closing quote optional), a parenthesis,
+# or a run of characters up to the next space, parenthesis or quote
+_TOKEN_PATTERN = re.compile(
+    r'"(?P<double>[^"]*)"?'
+    r"|'(?P<single>[^']*)'?"
+    r"|(?P<paren>[()])"
+    r"""|(?P<word>[^\s()'"]+)"""
+)
 
+_OPERATORS = ("AND", "OR", "NOT")
+
+
+def _match_all(_value: object) -> bool:
+    """Matcher for empty queries and sub-expressions, which match everything."""
+    return True
+
+
+@lru_cache(maxsize=256)
 def parse_search_expression(
     query: str,
 ) -> Callable[[list[str]], bool]:
@@ -52,7 +73,8 @@ def parse_search_expression(
 
     Returns:
         A function that takes a list of strings and returns True if
-        the expression matches any item in the list.
+        the expression matches any item in the list. Matchers are pure,
+        so the same function is returned for repeated queries.
 
     Examples:
         >>> matcher = parse_search_expression("Cork AND Population")
@@ -63,11 +85,18 @@ def parse_search_expression(
     tokens = _tokenise_expression(query)
     if not tokens:
         # Empty query matches everything
-        return lambda _items: True
+        return _match_all
 
     # Parse and return the matcher function
     pos = [0]  # Use list to allow modification in nested function
-    return _parse_or_expression(tokens, pos)
+    matcher = _parse_or_expression(tokens, pos)
+
+    # Term matchers compare against lowercase items, so lower each item once per
+    # call rather than once per term
+    def lowered_matcher(items: list[str]) -> bool:
+        return matcher([item.lower() for item in items])
+
+    return lowered_matcher
 
 
 def _tokenise_expression(query: str) -> list[str]:
@@ -82,47 +111,12 @@ def _tokenise_expression(query: str) -> list[str]:
     Returns:
         A list of tokens.
     """
-    tokens: list[str] = []
-    i = 0
-    query = query.strip()
-
-    while i < len(query):
-        # Skip whitespace
-        if query[i].isspace():
-            i += 1
-            continue
-
-        # Parentheses
-        if query[i] == "(":
-            tokens.append("(")
-            i += 1
-            continue
-        if query[i] == ")":
-            tokens.append(")")
-            i += 1
-            continue
-
-        # Quoted string
-        if query[i] in ('"', "'"):
-            quote_char = query[i]
-            i += 1
-            start = i
-            while i < len(query) and query[i] != quote_char:
-                i += 1
-            tokens.append(query[start:i])
-            if i < len(query):
-                i += 1  # Skip closing quote
-            continue
-
-        # Word (including AND/OR operators)
-        start = i
-        while i < len(query) and not query[i].isspace() and query[i] not in "()'\"":
-            i += 1
-        word = query[start:i]
-        if word:
-            tokens.append(word)
-
-    return tokens
+    # Exactly one named group matches per token, so lastgroup is never None. The
+    # query is stripped so an unterminated quote does not keep trailing spaces
+    return [
+        match.group(match.lastgroup)  # type: ignore[arg-type]
+        for match in _TOKEN_PATTERN.finditer(query.strip())
+    ]
 
 
 def _parse_or_expression(tokens: list[str], pos: list[int]) -> Callable[[list[str]], bool]:
@@ -212,6 +206,7 @@ def _parse_primary(tokens: list[str], pos: list[int]) -> Callable[[list[str]], b
     """Parse a primary expression (term or parenthesised expression).
 
     A primary is either a search term or a parenthesised sub-expression.
+    Term matchers expect items that have already been lowercased.
 
     Args:
         tokens: The list of tokens to parse.
@@ -220,8 +215,12 @@ def _parse_primary(tokens: list[str], pos: list[int]) -> Callable[[list[str]], b
     Returns:
         A matcher function for the primary expression.
     """
+    # Skip operators that might appear at start
+    while pos[0] < len(tokens) and tokens[pos[0]].upper() in _OPERATORS:
+        pos[0] += 1
+
     if pos[0] >= len(tokens):
-        return lambda _items: True
+        return _match_all
 
     token = tokens[pos[0]]
 
@@ -232,17 +231,12 @@ def _parse_primary(tokens: list[str], pos: list[int]) -> Callable[[list[str]], b
             pos[0] += 1  # Skip )
         return result
 
-    # Skip operators that might appear at start
-    if token.upper() in ("AND", "OR", "NOT"):
-        pos[0] += 1
-        return _parse_primary(tokens, pos)
-
     # It's a search term
     pos[0] += 1
     term = token.lower()
 
     def term_matcher(items: list[str], t: str = term) -> bool:
-        return any(t in item.lower() for item in items)
+        return any(t in item for item in items)
 
     return term_matcher
 
@@ -252,6 +246,7 @@ def _parse_primary(tokens: list[str], pos: list[int]) -> Callable[[list[str]], b
 # =============================================================================
 
 
+@lru_cache(maxsize=256)
 def parse_string_search_expression(
     query: str,
 ) -> Callable[[str], bool]:
@@ -267,7 +262,8 @@ def parse_string_search_expression(
 
     Returns:
         A function that takes a string and returns True if
-        the expression matches the string.
+        the expression matches the string. Matchers are pure, so the
+        same function is returned for repeated queries.
 
     Examples:
         >>> matcher = parse_string_search_expression("population AND NOT census")
@@ -276,10 +272,46 @@ def parse_string_search_expression(
     """
     tokens = _tokenise_expression(query)
     if not tokens:
-        return lambda _text: True
+        return _match_all
 
     pos = [0]
-    return _parse_string_or_expression(tokens, pos)
+    matcher = _parse_string_or_expression(tokens, pos)
+
+    # Term matchers compare against lowercase text, so lower it once per call
+    # rather than once per term
+    def lowered_matcher(text: str) -> bool:
+        return matcher(text.lower() if text else text)
+
+    return lowered_matcher
+
+
+def parse_single_term(query: str) -> str | None:
+    """Return the search term of a query that consists of a single term.
+
+    A lone term (or quoted phrase) matches by plain substring search, so
+    callers can evaluate it with vectorised string operations instead of a
+    parsed matcher.
+
+    Args:
+        query: A search expression.
+
+    Returns:
+        The lowercase term if the query is a single term, otherwise None.
+
+    Examples:
+        >>> parse_single_term('"Census Year"')
+        'census year'
+        >>> parse_single_term("population AND county") is None
+        True
+    """
+    tokens = _tokenise_expression(query)
+    if len(tokens) != 1:
+        return None
+    token = tokens[0]
+    # Empty quotes and lone operators or parentheses are left to the parser
+    if token in ("", "(", ")") or token.upper() in _OPERATORS:
+        return None
+    return token.lower()
 
 
 def _parse_string_or_expression(tokens: list[str], pos: list[int]) -> Callable[[str], bool]:
@@ -364,6 +396,7 @@ def _parse_string_primary(tokens: list[str], pos: list[int]) -> Callable[[str],
     """Parse a primary expression for string matching.
 
     A primary is either a search term or a parenthesised sub-expression.
+    Term matchers expect text that has already been lowercased.
 
     Args:
         tokens: The list of tokens to parse.
@@ -372,8 +405,11 @@ def _parse_string_primary(tokens: list[str], pos: list[int]) -> Callable[[str],
     Returns:
         A matcher function for the primary expression.
     """
+    while pos[0] < len(tokens) and tokens[pos[0]].upper() in _OPERATORS:
+        pos[0] += 1
+
     if pos[0] >= len(tokens):
-        return lambda _text: True
+        return _match_all
 
     token = tokens[pos[0]]
 
@@ -384,15 +420,11 @@ def _parse_string_primary(tokens: list[str], pos: list[int]) -> Callable[[str],
             pos[0] += 1
         return result
 
-    if token.upper() in ("AND", "OR", "NOT"):
-        pos[0] += 1
-        return _parse_string_primary(tokens, pos)
-
     pos[0] += 1
     term = token.lower()
 
     def term_matcher(text: str, t: str = term) -> bool:
-        return t in text.lower() if text else False
+        return t in text if text else False
 
     return term_matcher
 
@@ -462,11 +494,73 @@ def count_matching_terms(text: str, terms: list[str]) -> int:
     return sum(1 for term in terms if term in text_lower)
 
 
+def count_matching_terms_series(texts: pd.Series, terms: list[str]) -> pd.Series:
+    """Count how many search terms match within each text of a Series.
+
+    Vectorised equivalent of applying count_matching_terms to every element:
+    each term is searched for across the whole Series in one pass.
+
+    Args:
+        texts: A Series of texts to search within.
+        terms: A list of lowercase search terms.
+
+    Returns:
+        An integer Series of match counts aligned with texts. Missing or
+        empty texts count as zero.
+
+    Examples:
+        >>> texts = pd.Series(["Electoral Division Population", None])
+        >>> count_matching_terms_series(texts, ["electoral", "division"]).tolist()
+        [2, 0]
+    """
+    counts = pd.Series(0, index=texts.index)
+    lowered = texts.astype("string").str.lower()
+    for term in terms:
+        counts += lowered.str.contains(term, regex=False, na=False).astype(int)
+    return counts.where(lowered.fillna("") != "", 0)
+
+
 # =============================================================================
 # Date Range Parsing and Matching
 # =============================================================================
 
 
+# Precompiled patterns for the formats accepted by parse_date_input
+_YEAR_PATTERN = re.compile(r"^\d{4}$")
+_QUARTER_PATTERN = re.compile(r"^(?:(\d{4})\s*Q([1-4])|Q([1-4])\s*(\d{4}))$", re.IGNORECASE)
+_MONTH_NAME_YEAR_PATTERN = re.compile(r"^([a-zA-Z]+)\s+(\d{4})$")
+_YEAR_MONTH_NAME_PATTERN = re.compile(r"^(\d{4})\s+([a-zA-Z]+)$")
+_MONTH_NUMBER_PATTERN = re.compile(r"^(\d{4})[-/](\d{1,2})$|^(\d{1,2})[-/](\d{4})$")
+_ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_MONTH_NUMBERS = {
+    "january": 1,
+    "jan": 1,
+    "february": 2,
+    "feb": 2,
+    "march": 3,
+    "mar": 3,
+    "april": 4,
+    "apr": 4,
+    "may": 5,
+    "june": 6,
+    "jun": 6,
+    "july": 7,
+    "jul": 7,
+    "august": 8,
+    "aug": 8,
+    "september": 9,
+    "sep": 9,
+    "sept": 9,
+    "october": 10,
+    "oct": 10,
+    "november": 11,
+    "nov": 11,
+    "december": 12,
+    "dec": 12,
+}
+
+
 def parse_date_range_tuple(query: str) -> tuple[str, str] | None:
     """Parse a date range tuple from query string.
 
@@ -508,13 +602,11 @@ def parse_date_input(date_str: str) -> tuple[date | None, str]:
     date_str = date_str.strip()
 
     # Try year only (e.g., "2023")
-    if re.match(r"^\d{4}$", date_str):
+    if _YEAR_PATTERN.match(date_str):
         return date(int(date_str), 1, 1), "year"
 
     # Try quarter format (e.g., "2023Q1", "Q1 2023", "2023 Q1", "1999Q1")
-    quarter_match = re.match(
-        r"^(?:(\d{4})\s*Q([1-4])|Q([1-4])\s*(\d{4}))$", date_str, re.IGNORECASE
-    )
+    quarter_match = _QUARTER_PATTERN.match(date_str)
     if quarter_match:
         if quarter_match.group(1):
             year = int(quarter_match.group(1))
@@ -526,50 +618,22 @@ def parse_date_input(date_str: str) -> tuple[date | None, str]:
         month = (quarter - 1) * 3 + 1
         return date(year, month, 1), "quarter"
 
-    # Try month-year formats
-    month_names = {
-        "january": 1,
-        "jan": 1,
-        "february": 2,
-        "feb": 2,
-        "march": 3,
-        "mar": 3,
-        "april": 4,
-        "apr": 4,
-        "may": 5,
-        "june": 6,
-        "jun": 6,
-        "july": 7,
-        "jul": 7,
-        "august": 8,
-        "aug": 8,
-        "september": 9,
-        "sep": 9,
-        "sept": 9,
-        "october": 10,
-        "oct": 10,
-        "november": 11,
-        "nov": 11,
-        "december": 12,
-        "dec": 12,
-    }
-
     # "January 2023" or "Jan 2023"
-    month_year_match = re.match(r"^([a-zA-Z]+)\s+(\d{4})$", date_str)
+    month_year_match = _MONTH_NAME_YEAR_PATTERN.match(date_str)
     if month_year_match:
         month_name = month_year_match.group(1).lower()
-        if month_name in month_names:
-            return date(int(month_year_match.group(2)), month_names[month_name], 1), "month"
+        if month_name in _MONTH_NUMBERS:
+            return date(int(month_year_match.group(2)), _MONTH_NUMBERS[month_name], 1), "month"
 
     # "2023 January" or "2023 Jan"
-    year_month_match = re.match(r"^(\d{4})\s+([a-zA-Z]+)$", date_str)
+    year_month_match = _YEAR_MONTH_NAME_PATTERN.match(date_str)
     if year_month_match:
         month_name = year_month_match.group(2).lower()
-        if month_name in month_names:
-            return date(int(year_month_match.group(1)), month_names[month_name], 1), "month"
+        if month_name in _MONTH_NUMBERS:
+            return date(int(year_month_match.group(1)), _MONTH_NUMBERS[month_name], 1), "month"
 
     # "2023-01" or "01/2023" or "2023/01"
-    month_num_match = re.match(r"^(\d{4})[-/](\d{1,2})$|^(\d{1,2})[-/](\d{4})$", date_str)
+    month_num_match = _MONTH_NUMBER_PATTERN.match(date_str)
     if month_num_match:
         if month_num_match.group(1):
             year = int(month_num_match.group(1))
@@ -581,11 +645,10 @@ def parse_date_input(date_str: str) -> tuple[date | None, str]:
             return date(year, month, 1), "month"
 
     # Try ISO format (YYYY-MM-DD) first without dayfirst
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+    if _ISO_DATE_PATTERN.match(date_str):
         try:
-            parsed = pd.to_datetime(date_str, format="%Y-%m-%d")
-            return parsed.date(), "day"
-        except (ValueError, TypeError):
+            return date.fromisoformat(date_str), "day"
+        except ValueError:
             pass
 
     # Try full date formats using pandas for flexibility (dayfirst for European dates)
@@ -620,23 +683,11 @@ def adjust_date_to_period_end(d: date, granularity: str) -> date:
     """
     if granularity == "year":
         return date(d.year, 12, 31)
-    elif granularity == "quarter":
-        quarter_end_month = d.month + 2
-        if quarter_end_month <= 3:
-            return date(d.year, 3, 31)
-        elif quarter_end_month <= 6:
-            return date(d.year, 6, 30)
-        elif quarter_end_month <= 9:
-            return date(d.year, 9, 30)
-        else:
-            return date(d.year, 12, 31)
-    elif granularity == "month":
-        if d.month == 12:
-            return date(d.year, 12, 31)
-        else:
-            next_month = date(d.year, d.month + 1, 1)
-            end = next_month - pd.Timedelta(days=1)
-            return end.date() if hasattr(end, "date") else end  # type: ignore
+    if granularity == "quarter":
+        quarter_end_month = (d.month - 1) // 3 * 3 + 3
+        return date(d.year, quarter_end_month, monthrange(d.year, quarter_end_month)[1])
+    if granularity == "month":
+        return date(d.year, d.month, monthrange(d.year, d.month)[1])
     return d
 
 
@@ -662,23 +713,11 @@ def date_range_overlaps(
     if not date_range_str or pd.isna(date_range_str):
         return False
 
-    parts = date_range_str.split(" - ")
-    if len(parts) == 1:
-        start_str = end_str = parts[0].strip()
-    elif len(parts) == 2:
-        start_str = parts[0].strip()
-        end_str = parts[1].strip()
-    else:
-        return False
-
-    start_date, _start_gran = parse_date_input(start_str)
-    end_date, end_gran = parse_date_input(end_str)
-
-    if start_date is None or end_date is None:
+    date_range = _parse_date_range(date_range_str)
+    if date_range is None:
         return False
+    start_date, end_date = date_range
 
-    # Adjust end date to end of period
-    end_date = adjust_date_to_period_end(end_date, end_gran)
     query_end = adjust_date_to_period_end(query_end, query_end_gran)
 
     # Check overlap: ranges overlap if start1 <= end2 AND start2 <= end1
@@ -702,30 +741,48 @@ def date_in_date_range(query_date: date, granularity: str, date_range_str: str)
     if not date_range_str or pd.isna(date_range_str):
         return False
 
+    date_range = _parse_date_range(date_range_str)
+    if date_range is None:
+        return False
+    start_date, end_date = date_range
+
+    # For query date, we also need to consider its range based on granularity
+    query_end = adjust_date_to_period_end(query_date, granularity)
+
+    # Check if ranges overlap
+    # Two ranges overlap if: start1 <= end2 AND start2 <= end1
+    return query_date <= end_date and start_date <= query_end
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_range(date_range_str: str) -> tuple[date, date] | None:
+    """Parse a date range string into its start date and end-of-period date.
+
+    The catalogue repeats the same few range strings across many rows, so
+    results are memoised.
+
+    Args:
+        date_range_str: The date range string (e.g., "2015 - 2024"). A single
+            value is treated as a range that starts and ends on that value.
+
+    Returns:
+        A tuple of (start_date, end_date) with the end date adjusted to the end
+        of its period, or None if the string cannot be parsed.
+    """
     # Split on " - " to get start and end
     parts = date_range_str.split(" - ")
     if len(parts) == 1:
-        # Single value, check if it matches
         start_str = end_str = parts[0].strip()
     elif len(parts) == 2:
         start_str = parts[0].strip()
         end_str = parts[1].strip()
     else:
-        return False
+        return None
 
-    # Parse start and end dates
     start_date, _start_gran = parse_date_input(start_str)
     end_date, end_gran = parse_date_input(end_str)
 
     if start_date is None or end_date is None:
-        return False
-
-    # Adjust end date to end of period based on granularity
-    end_date = adjust_date_to_period_end(end_date, end_gran)
-
-    # For query date, we also need to consider its range based on granularity
-    query_end = adjust_date_to_period_end(query_date, granularity)
+        return None
 
-    # Check if ranges overlap
-    # Two ranges overlap if: start1 <= end2 AND start2 <= end1
-    return query_date <= end_date and start_date <= query_end
+    return start_date, adjust_date_to_period_end(end_date, end_gran)
@@ -17,12 +17,17 @@ Examples:
 from __future__ import annotations
 
 import io
+import threading
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from cachetools import TTLCache
 
 from pycsodata.constants import (
+    CACHE_TTL_SECONDS,
     DEFAULT_CRS,
     ID_COLUMN_SUFFIX,
     MET_EIREANN_SPATIAL_KEY,
@@ -31,6 +36,20 @@ from pycsodata.constants import (
 from pycsodata.exceptions import SpatialError
 from pycsodata.fetchers import fetch_json
 
+# Boundary GeoDataFrames keyed by URL, each stored with the GeoJSON it was
+# built from so that a refreshed or flushed response is never served stale
+_boundary_cache: TTLCache[str, tuple[dict[str, Any], gpd.GeoDataFrame]] = TTLCache(
+    maxsize=16, ttl=CACHE_TTL_SECONDS
+)
+_boundary_cache_lock = threading.Lock()
+
+
+def _clear_boundary_cache() -> None:
+    """Drop all cached boundary GeoDataFrames (called by flush_cache)."""
+    with _boundary_cache_lock:
+        _boundary_cache.clear()
+
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -75,20 +94,9 @@ def create_geodataframe(
         raise SpatialError("Dataset has no spatial information available.")
 
     try:
-        # Fetch and parse the GeoJSON
+        # Fetch the GeoJSON and build (or reuse) its boundary GeoDataFrame
         geojson = fetch_json(spatial_url, cache=cache)
-        features = geojson.get("features", [])
-
-        if not features:
-            raise SpatialError("No features found in GeoJSON data.")
-
-        # Create GeoDataFrame from features
-        gdf = gpd.GeoDataFrame.from_features(features)
-
-        # Set CRS if not present
-        if gdf.crs is None:
-            detected_crs = _detect_crs(geojson)
-            gdf = gdf.set_crs(detected_crs)
+        gdf = _boundaries_from_geojson(spatial_url, geojson, cache=cache)
 
         # Merge with the data DataFrame
         merged = _merge_dataframes(df, gdf, spatial_key, geojson)
@@ -145,13 +153,11 @@ def create_met_geodataframe(
         # Merge using a temporary normalized key to avoid mutating the caller's DataFrame
         normalized_spatial_key = df[spatial_key].str.strip().str.title()
 
-        merged = df.merge(
-            stations_gdf[["station_id", "geometry"]],
-            left_on=normalized_spatial_key,
-            right_on="station_id",
-            how="left",
-            validate="many_to_one",
-        ).drop(columns=["station_id"])
+        geometry = _map_geometries(
+            normalized_spatial_key, stations_gdf["station_id"], stations_gdf["geometry"]
+        )
+        merged = df.reset_index(drop=True)
+        merged["geometry"] = geometry.to_numpy()
 
         if "geometry" not in merged.columns:
             raise SpatialError(
@@ -195,6 +201,59 @@ def _build_weather_stations_gdf() -> gpd.GeoDataFrame:
 # =============================================================================
 
 
+def _boundaries_from_geojson(
+    spatial_url: str, geojson: dict[str, Any], *, cache: bool
+) -> gpd.GeoDataFrame:
+    """Build the boundary GeoDataFrame for a GeoJSON response.
+
+    Many tables share the same boundary URL, so the GeoDataFrame is kept
+    alongside the GeoJSON it was built from. It is reused only while
+    fetch_json keeps returning that same cached object, which ties it to
+    the HTTP cache's TTL and to flush_cache(). The cached GeoDataFrame is
+    never returned to callers; merging always produces a new frame.
+
+    Args:
+        spatial_url: URL the GeoJSON was fetched from.
+        geojson: The parsed GeoJSON dictionary.
+        cache: Whether to reuse and store the built GeoDataFrame.
+
+    Returns:
+        A GeoDataFrame of the boundary features with usable (non-null,
+        non-empty) geometry and a CRS set.
+
+    Raises:
+        SpatialError: If the GeoJSON contains no features.
+    """
+    if cache:
+        with _boundary_cache_lock:
+            cached = _boundary_cache.get(spatial_url)
+        if cached is not None and cached[0] is geojson:
+            return cached[1]
+
+    features = geojson.get("features", [])
+    if not features:
+        raise SpatialError("No features found in GeoJSON data.")
+
+    # Create GeoDataFrame from features
+    gdf = gpd.GeoDataFrame.from_features(features)
+
+    # Null or empty boundaries can never supply a geometry, so drop them once
+    # here rather than copying the cached frame on every merge
+    geometries = gdf["geometry"].to_numpy()
+    usable = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    if not usable.all():
+        gdf = gdf[usable]
+
+    # Set CRS if not present
+    if gdf.crs is None:
+        gdf = gdf.set_crs(_detect_crs(geojson))
+
+    if cache:
+        with _boundary_cache_lock:
+            _boundary_cache[spatial_url] = (geojson, gdf)
+    return gdf
+
+
 def _detect_crs(geojson: dict[str, Any]) -> str:
     """Detect CRS from a GeoJSON structure.
 
@@ -221,6 +280,41 @@ def _detect_crs(geojson: dict[str, Any]) -> str:
     return DEFAULT_CRS
 
 
+def _map_geometries(
+    keys: pd.Series,
+    boundary_keys: pd.Series,
+    geometries: pd.Series,
+) -> pd.Series:
+    """Look up the boundary geometry for each join key.
+
+    Equivalent to a left merge validated as many-to-one, but implemented as
+    a positional take through one hash index of the boundary keys, so the
+    data columns are not copied through a join.
+
+    Args:
+        keys: The join key for each data row.
+        boundary_keys: The join key of each boundary feature.
+        geometries: The boundary geometries, aligned with boundary_keys.
+
+    Returns:
+        The matching geometry for each key, aligned with keys. Keys
+        without a matching boundary map to a missing value.
+
+    Raises:
+        SpatialError: If boundary_keys contains duplicate values.
+    """
+    # The index's hash table serves both the uniqueness check and the lookup
+    boundary_index = pd.Index(boundary_keys.to_numpy())
+    if not boundary_index.is_unique:
+        raise SpatialError("Boundary keys are not unique; cannot perform a many-to-one merge.")
+
+    positions = boundary_index.get_indexer(keys.to_numpy())
+    matched = positions >= 0
+    result = np.full(len(keys), None, dtype=object)
+    result[matched] = geometries.to_numpy()[positions[matched]]
+    return pd.Series(result, index=keys.index)
+
+
 def _merge_dataframes(
     df: pd.DataFrame,
     gdf: gpd.GeoDataFrame,
@@ -233,13 +327,16 @@ def _merge_dataframes(
     Rows without matching geometries (e.g., aggregate regions like "State")
     will have null geometries.
 
+    The boundary GeoDataFrame is only read, never copied or modified; it is
+    expected to contain usable geometries only (see _boundaries_from_geojson).
+
     Tries multiple merge strategies based on available columns:
     1. Join on ID column (e.g., "County ID") to "code" column in GeoJSON.
     2. Join on label column (e.g., "County") if matching column exists.
 
     Args:
         df: The data DataFrame.
-        gdf: The spatial GeoDataFrame from GeoJSON.
+        gdf: The boundary GeoDataFrame from _boundaries_from_geojson.
         spatial_key: The dimension label for joining (e.g., "County").
         geojson: The original GeoJSON (for CRS fallback).
 
@@ -258,22 +355,15 @@ def _merge_dataframes(
 
         # Strategy 1: Join on ID column to 'code' column
         if id_column in df.columns and "code" in gdf.columns:
-            merged = df.merge(
-                gdf[["code", "geometry"]],
-                left_on=id_column,
-                right_on="code",
-                how="left",
-                validate="many_to_one",
-            ).drop(columns=["code"])
+            geometry = _map_geometries(df[id_column], gdf["code"], gdf["geometry"])
+            merged = df.reset_index(drop=True)
+            merged["geometry"] = geometry.to_numpy()
 
         # Strategy 2: Join on label column
         elif spatial_key in df.columns and spatial_key in gdf.columns:
-            merged = df.merge(
-                gdf[[spatial_key, "geometry"]],
-                on=spatial_key,
-                how="left",
-                validate="many_to_one",
-            )
+            geometry = _map_geometries(df[spatial_key], gdf[spatial_key], gdf["geometry"])
+            merged = df.reset_index(drop=True)
+            merged["geometry"] = geometry.to_numpy()
 
         if merged is None:
             raise SpatialError("Could not find suitable columns for spatial merge.")
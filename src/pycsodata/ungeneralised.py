@@ -709,7 +709,9 @@ def _force_2d(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """Force all geometries in a GeoDataFrame to 2D.
 
     If any geometry has Z coordinates (e.g. POLYGON Z, MULTIPOLYGON Z),
-    applies ``shapely.force_2d`` to strip the Z dimension.
+    applies ``shapely.force_2d`` to strip the Z dimension. Both the check
+    and the conversion run as single vectorised shapely calls over the
+    geometry array rather than per-geometry Python callbacks.
 
     Args:
         gdf: The GeoDataFrame to process.
@@ -720,11 +722,11 @@ def _force_2d(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     if gdf.geometry.isna().all():
         return gdf
 
-    has_z = gdf.geometry.dropna().apply(lambda g: g.has_z).any()
-    if has_z:
+    geometries = gdf.geometry.to_numpy()
+    if shapely.has_z(geometries).any():
         logger.debug("Detected 3D geometries (Z coordinates); forcing to 2D.")
         gdf = gdf.copy()
-        gdf["geometry"] = gdf.geometry.apply(lambda g: shapely.force_2d(g) if g is not None else g)
+        gdf["geometry"] = gpd.GeoSeries(shapely.force_2d(geometries), index=gdf.index, crs=gdf.crs)
     return gdf
 
 
@@ -750,10 +752,8 @@ def _count_coordinates(gdf: gpd.GeoDataFrame) -> int:
         pass
 
     try:
-        import shapely
-
-        return int(sum(shapely.get_num_coordinates(g) for g in non_null.geometry if g is not None))
-    except (ImportError, AttributeError):
+        return int(shapely.get_num_coordinates(non_null.geometry.to_numpy()).sum())
+    except AttributeError:
         return 0
 
 
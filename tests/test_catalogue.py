@@ -7,6 +7,7 @@ import pytest
 
 from pycsodata import CSOCache
 from pycsodata.catalogue import CSOCatalogue
+from pycsodata.search import parse_string_search_expression
 
 # Use CSOCache for cache management
 _cache = CSOCache()
@@ -506,6 +507,15 @@ class TestCSOCatalogueSearchFilters:
         assert not result[1]
         assert not result[2]
 
+    @pytest.mark.parametrize("query", ["census", '"Census of"', "CENSUS", "x"])
+    def test_text_matches_single_term_agrees_with_matcher(self, query):
+        """Test that the vectorised single-term path matches the parsed matcher."""
+        series = pd.Series(["Census of Population", "", None, "Irish census"])
+        result = CSOCatalogue._text_matches_expression(series, query)
+        matcher = parse_string_search_expression(query)
+        expected = [pd.notna(text) and matcher(text) for text in series]
+        assert result.tolist() == expected
+
 
 class TestCSOCatalogueListContainsExpression:
     """Tests for _list_contains_expression method."""
@@ -525,6 +535,24 @@ class TestCSOCatalogueListContainsExpression:
         assert result[1]
 
 
+class TestCSOCatalogueRelevance:
+    """Tests for _calculate_relevance method."""
+
+    def test_scores_title_and_variable_matches(self):
+        """Test that title and variable term matches add up per row."""
+        df = pd.DataFrame(
+            {
+                "Title": ["Population by County", "Births by Sex", None],
+                "Variables": [["County", "Year"], [], ["County"]],
+            },
+            index=[3, 5, 7],
+        )
+        scores = CSOCatalogue._calculate_relevance(
+            df, title="population OR births", variables="county"
+        )
+        assert scores.to_dict() == {3: 2, 5: 1, 7: 1}
+
+
 class TestCSOCatalogueDateRangeFilter:
     """Tests for _date_range_filter method."""
 
@@ -5,6 +5,7 @@ from typing import cast
 import geopandas as gpd
 import pandas as pd
 import pytest
+from pandas.api.types import is_datetime64_any_dtype, is_integer_dtype, is_numeric_dtype
 
 from pycsodata import CSOCache
 from pycsodata._types import FilterValue, IncludeIDs, PivotFormat
@@ -20,6 +21,27 @@ def flush_cache():
     _cache.flush()
 
 
+def _require_spatial(dataset: CSODataset) -> CSODataset:
+    """Skip the calling test if the dataset has no spatial data."""
+    if not dataset.has_spatial_data:
+        pytest.skip(f"{dataset.table_code} has no spatial data")
+    return dataset
+
+
+@pytest.fixture(scope="module")
+def spatial_fy003a() -> CSODataset:
+    """FY003A loaded once per module, skipping if spatial data is unavailable."""
+    flush_cache()
+    return _require_spatial(CSODataset("FY003A"))
+
+
+@pytest.fixture(scope="module")
+def fy003a_all_ids() -> CSODataset:
+    """FY003A with every ID column, loaded once for include_ids tests."""
+    flush_cache()
+    return CSODataset("FY003A", include_ids=IncludeIDs.ALL)
+
+
 class TestCSODatasetInit:
     """Tests for CSODataset initialisation."""
 
@@ -185,15 +207,11 @@ class TestCSODatasetGdf:
     """Tests for the gdf method."""
 
     @pytest.mark.network
-    def test_returns_geodataframe(self):
+    def test_returns_geodataframe(self, spatial_fy003a):
         """Test that gdf returns a GeoDataFrame."""
-        flush_cache()
-        dataset = CSODataset("FY003A")
-
-        if dataset.has_spatial_data:
-            gdf = dataset.gdf()
-            assert isinstance(gdf, gpd.GeoDataFrame)
-            assert "geometry" in gdf.columns
+        gdf = spatial_fy003a.gdf()
+        assert isinstance(gdf, gpd.GeoDataFrame)
+        assert "geometry" in gdf.columns
 
     @pytest.mark.network
     def test_raises_for_non_spatial_dataset(self):
@@ -207,14 +225,10 @@ class TestCSODatasetGdf:
                 dataset.gdf()
 
     @pytest.mark.network
-    def test_invalid_pivot_format_raises(self):
+    def test_invalid_pivot_format_raises(self, spatial_fy003a):
         """Test that invalid pivot format raises ValidationError."""
-        flush_cache()
-        dataset = CSODataset("FY003A")
-
-        if dataset.has_spatial_data:
-            with pytest.raises(ValidationError, match="Invalid pivot_format"):
-                dataset.gdf(pivot_format="invalid")
+        with pytest.raises(ValidationError, match="Invalid pivot_format"):
+            spatial_fy003a.gdf(pivot_format="invalid")
 
 
 class TestCSODatasetFilters:
@@ -283,27 +297,36 @@ class TestCSODatasetIncludeIds:
             assert id_cols == [spatial_id] or len(id_cols) == 0
 
     @pytest.mark.network
-    def test_include_ids_list_single_column(self):
-        """Test that include_ids list with single column keeps only that ID."""
-        flush_cache()
-        dataset = CSODataset("FY003A", include_ids=["CensusYear"])
-        df = dataset.df()
-
-        id_cols = [c for c in df.columns if c.endswith(" ID")]
-        assert id_cols == ["CensusYear ID"]
-
-    @pytest.mark.network
-    def test_include_ids_list_multiple_columns(self):
-        """Test that include_ids list with multiple columns keeps specified IDs."""
-        flush_cache()
-        dataset = CSODataset("FY003A", include_ids=["CensusYear", "Sex"])
-        df = dataset.df()
-
+    @pytest.mark.parametrize(
+        ("include_ids", "expected"),
+        [
+            (["CensusYear"], {"CensusYear ID"}),
+            (["CensusYear", "Sex"], {"CensusYear ID", "Sex ID"}),
+            ([], set()),
+            (["NonExistentColumn"], ValidationError),
+            (["CensusYear", "NotAColumn"], ValidationError),
+        ],
+        ids=[
+            "single_column",
+            "multiple_columns",
+            "empty_list",
+            "nonexistent_column_raises",
+            "partially_invalid_raises",
+        ],
+    )
+    def test_include_ids_list(self, fy003a_all_ids, monkeypatch, include_ids, expected):
+        """Test that include_ids lists keep only the requested ID columns."""
+        base_df = fy003a_all_ids.df(copy=False)
+        monkeypatch.setattr(fy003a_all_ids, "_include_ids", include_ids)
+
+        if expected is ValidationError:
+            with pytest.raises(ValidationError, match="include_ids contains column names"):
+                fy003a_all_ids._filter_id_columns(base_df)
+            return
+
+        df = fy003a_all_ids._filter_id_columns(base_df)
         id_cols = {c for c in df.columns if c.endswith(" ID")}
-        assert "CensusYear ID" in id_cols
-        assert "Sex ID" in id_cols
-        # Should only have the specified ID columns
-        assert id_cols == {"CensusYear ID", "Sex ID"}
+        assert id_cols == expected
 
 
 class TestCSODatasetStatisticnormalisation:
@@ -606,7 +629,7 @@ class TestCSODatasetNormalisation:
         dataset = CSODataset("FY003A")
         df = dataset.df()
 
-        assert df["value"].dtype in ("float64", "int64", "float32", "int32")
+        assert is_numeric_dtype(df["value"])
 
     @pytest.mark.network
     def test_normalise_statistic_id_column(self):
@@ -629,34 +652,6 @@ class TestCSODatasetIncludeIdsEdgeCases:
         with pytest.raises(ValidationError, match="include_ids list must contain only strings"):
             CSODataset("FY003A", include_ids=[123, "County"])  # type: ignore
 
-    @pytest.mark.network
-    def test_include_ids_empty_list(self):
-        """Test that include_ids with empty list drops all ID columns."""
-        flush_cache()
-        dataset = CSODataset("FY003A", include_ids=[])
-        df = dataset.df()
-
-        id_cols = [c for c in df.columns if c.endswith(" ID")]
-        assert len(id_cols) == 0
-
-    @pytest.mark.network
-    def test_include_ids_nonexistent_column_raises(self):
-        """Test that include_ids with non-existent column raises ValidationError."""
-        flush_cache()
-        dataset = CSODataset("FY003A", include_ids=["NonExistentColumn"])
-
-        with pytest.raises(ValidationError, match="include_ids contains column names"):
-            dataset.df()
-
-    @pytest.mark.network
-    def test_include_ids_partially_invalid_raises(self):
-        """Test that include_ids with some invalid columns raises ValidationError."""
-        flush_cache()
-        dataset = CSODataset("FY003A", include_ids=["CensusYear", "NotAColumn"])
-
-        with pytest.raises(ValidationError, match="include_ids contains column names"):
-            dataset.df()
-
     @pytest.mark.network
     def test_include_ids_invalid_error_message_shows_valid_dimensions(self):
         """Test that ValidationError message shows valid dimension names."""
@@ -778,107 +773,101 @@ class TestCSODatasetConvertDates:
         time_var = dataset.metadata.get("time_variable")
         if time_var and time_var in df.columns:
             # Should be numeric (year) or datetime
-            assert df[time_var].dtype in ("int64", "int32", "datetime64[ns]") or str(
-                df[time_var].dtype
-            ).startswith("period")
+            col = df[time_var]
+            assert (
+                is_integer_dtype(col)
+                or is_datetime64_any_dtype(col)
+                or isinstance(col.dtype, pd.PeriodDtype)
+            )
 
 
 class TestCSODatasetGdfEdgeCases:
     """Edge case tests for gdf method."""
 
     @pytest.mark.network
-    def test_gdf_caches_result(self):
+    def test_gdf_caches_result(self, spatial_fy003a):
         """Test that gdf result is cached."""
-        flush_cache()
-        dataset = CSODataset("FY003A")
+        gdf1 = spatial_fy003a.gdf()
+        gdf2 = spatial_fy003a.gdf()
 
-        if dataset.has_spatial_data:
-            gdf1 = dataset.gdf()
-            gdf2 = dataset.gdf()
-
-            # Should return cached result (same object)
-            pd.testing.assert_frame_equal(gdf1, gdf2)
+        # Should return cached result (same object)
+        pd.testing.assert_frame_equal(gdf1, gdf2)
 
     @pytest.mark.network
     def test_gdf_wide_format(self):
         """Test gdf with wide pivot format."""
         flush_cache()
-        dataset = CSODataset("FY003A", filters={"Statistic": ["Population"]})
+        dataset = _require_spatial(CSODataset("FY003A", filters={"Statistic": ["Population"]}))
 
-        if dataset.has_spatial_data:
-            gdf = dataset.gdf("wide")
-            assert isinstance(gdf, gpd.GeoDataFrame)
-            assert "geometry" in gdf.columns
+        gdf = dataset.gdf("wide")
+        assert isinstance(gdf, gpd.GeoDataFrame)
+        assert "geometry" in gdf.columns
 
     @pytest.mark.network
     def test_gdf_tidy_format(self):
         """Test gdf with tidy pivot format."""
         flush_cache()
-        dataset = CSODataset("FY003A", filters={"CensusYear": ["2022"]})
+        dataset = _require_spatial(CSODataset("FY003A", filters={"CensusYear": ["2022"]}))
 
-        if dataset.has_spatial_data:
-            gdf = dataset.gdf("tidy")
-            assert isinstance(gdf, gpd.GeoDataFrame)
-            assert "geometry" in gdf.columns
+        gdf = dataset.gdf("tidy")
+        assert isinstance(gdf, gpd.GeoDataFrame)
+        assert "geometry" in gdf.columns
 
     @pytest.mark.network
     def test_gdf_preserves_aggregate_rows_with_null_geometry(self):
         """Test that gdf includes rows for aggregate regions with null geometries."""
         flush_cache()
         # NDQ09 has 'State' as an aggregate region in 'Local Electoral Area'
-        dataset = CSODataset("NDQ09", include_ids="all")
+        dataset = _require_spatial(CSODataset("NDQ09", include_ids="all"))
 
-        if dataset.has_spatial_data:
-            df = dataset.df()
-            gdf = dataset.gdf()
+        df = dataset.df()
+        gdf = dataset.gdf()
 
-            # Both should have the same number of rows
-            assert len(gdf) == len(df)
+        # Both should have the same number of rows
+        assert len(gdf) == len(df)
 
-            # Check that aggregate rows exist with null geometries
-            spatial_key = dataset.spatial_info.key
-            if "State" in df[spatial_key].values:
-                state_rows = gdf[gdf[spatial_key] == "State"]
-                assert len(state_rows) > 0
-                # State rows should have null geometries
-                assert state_rows.geometry.isna().all()
+        # Check that aggregate rows exist with null geometries
+        spatial_key = dataset.spatial_info.key
+        if "State" in df[spatial_key].values:
+            state_rows = gdf[gdf[spatial_key] == "State"]
+            assert len(state_rows) > 0
+            # State rows should have null geometries
+            assert state_rows.geometry.isna().all()
 
     @pytest.mark.network
     def test_gdf_df_have_same_row_count(self):
         """Test that gdf and df always have the same number of rows."""
         flush_cache()
-        dataset = CSODataset("FY003A", include_ids="all")
+        dataset = _require_spatial(CSODataset("FY003A", include_ids="all"))
 
-        if dataset.has_spatial_data:
-            df = dataset.df()
-            gdf = dataset.gdf()
+        df = dataset.df()
+        gdf = dataset.gdf()
 
-            assert len(gdf) == len(df)
+        assert len(gdf) == len(df)
 
-            # Check that areas missing from spatial data have null geometries
-            null_geom_count = gdf.geometry.isna().sum()
-            # There may be some null geometries for aggregate regions
-            assert null_geom_count >= 0  # Just checking no error occurs
+        # Check that areas missing from spatial data have null geometries
+        null_geom_count = gdf.geometry.isna().sum()
+        # There may be some null geometries for aggregate regions
+        assert null_geom_count >= 0  # Just checking no error occurs
 
     @pytest.mark.network
     def test_gdf_df_have_same_row_count_wide_format(self):
         """Test that gdf and df have same row count in wide format."""
         flush_cache()
         # Use filter to ensure pivot works without duplicates
-        dataset = CSODataset("NDQ09", include_ids="all")
+        dataset = _require_spatial(CSODataset("NDQ09", include_ids="all"))
 
-        if dataset.has_spatial_data:
-            df_wide = dataset.df("wide")
-            gdf_wide = dataset.gdf("wide")
+        df_wide = dataset.df("wide")
+        gdf_wide = dataset.gdf("wide")
 
-            assert len(gdf_wide) == len(df_wide)
+        assert len(gdf_wide) == len(df_wide)
 
-            # Verify aggregate regions with null geometry are preserved
-            spatial_key = dataset.spatial_info.key
-            if "State" in df_wide[spatial_key].values:
-                assert "State" in gdf_wide[spatial_key].values
-                state_rows = gdf_wide[gdf_wide[spatial_key] == "State"]
-                assert state_rows.geometry.isna().all()
+        # Verify aggregate regions with null geometry are preserved
+        spatial_key = dataset.spatial_info.key
+        if "State" in df_wide[spatial_key].values:
+            assert "State" in gdf_wide[spatial_key].values
+            state_rows = gdf_wide[gdf_wide[spatial_key] == "State"]
+            assert state_rows.geometry.isna().all()
 
     def test_gdf_df_have_same_row_count_tidy_format(self):
         """Test tidy pivot keeps gdf/df row counts aligned and null geometry rows."""
@@ -994,6 +983,41 @@ class TestCSODatasetMetadataEdgeCases:
         for var in meta.get("variables", []):
             assert "  " not in var
 
+    def test_metadata_parsed_once(self):
+        """Test that repeated metadata access reuses the parsed result."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset()
+        with patch(
+            "pycsodata.dataset.parse_metadata", return_value={"table_code": "TEST01"}
+        ) as mock_parse:
+            first = dataset.metadata
+            second = dataset.metadata
+
+        assert first == second
+        mock_parse.assert_called_once()
+
+    def test_metadata_returns_copy(self):
+        """Test that mutating returned metadata does not affect the dataset."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset()
+        with patch(
+            "pycsodata.dataset.parse_metadata",
+            return_value={"time_variable": "Year", "variables": ["County", "Year"]},
+        ):
+            meta = dataset.metadata
+            meta["time_variable"] = "Month"
+            meta["variables"].append("Sex")
+
+            assert dataset.metadata == {"time_variable": "Year", "variables": ["County", "Year"]}
+
+    def test_metadata_is_read_only(self):
+        """Test that the metadata property cannot be reassigned."""
+        dataset = _make_offline_dataset()
+        with pytest.raises(AttributeError):
+            dataset.metadata = {}  # type: ignore[misc]
+
 
 class TestCSODatasetDfCaching:
     """Tests for df caching."""
@@ -1431,6 +1455,7 @@ def _make_offline_dataset(
     dataset._cached_gdf_ungeneralised = None
     dataset._cached_base_df = base_df
     dataset._cached_df = None
+    dataset._cached_pivots = {}
     dataset._filters = filters
     dataset._drop_filtered_cols = drop_filtered_cols
     dataset._cache_enabled = True
@@ -1440,6 +1465,7 @@ def _make_offline_dataset(
     dataset._drop_national_data = False
     dataset._original_column_names = []
     dataset._sanitise_to_original_map = {}
+    dataset._normalised_filters = dataset._normalise_filter_keys(filters) if filters else None
     return dataset
 
 
@@ -1661,6 +1687,18 @@ class TestFilterIdColumnsUnit:
         with pytest.raises(ValidationError, match="not dimensions"):
             dataset._filter_id_columns(df)
 
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            ("all", IncludeIDs.ALL),
+            (" Spatial_Only ", IncludeIDs.SPATIAL_ONLY),
+            ("NONE", IncludeIDs.NONE),
+        ],
+    )
+    def test_string_specs_normalise_to_enum_members(self, spec, expected):
+        """Test string include_ids specs normalise to the enum singletons."""
+        assert CSODataset._normalise_include_ids(spec) is expected
+
 
 # =============================================================================
 # Unit tests for _remove_national_rows (no network)
@@ -1746,7 +1784,7 @@ class TestBuildGdfSpatialErrors:
         )
 
         with (
-            patch("pycsodata.dataset.create_geodataframe", return_value=fake_gdf),
+            patch("pycsodata.spatial.create_geodataframe", return_value=fake_gdf),
             pytest.raises(SpatialError, match="no geometry column"),
         ):
             dataset._build_gdf()
@@ -1766,7 +1804,7 @@ class TestBuildGdfSpatialErrors:
         )
 
         with (
-            patch("pycsodata.dataset.create_geodataframe", return_value=empty_gdf),
+            patch("pycsodata.spatial.create_geodataframe", return_value=empty_gdf),
             pytest.raises(SpatialError, match="geometries are missing or empty"),
         ):
             dataset._build_gdf()
@@ -1812,6 +1850,30 @@ class TestPivotWideDuplicateDetection:
             ):
                 dataset._pivot_wide(df)
 
+    def test_label_and_id_columns_are_not_cross_joined(self):
+        """Test that wide pivots only contain label/ID pairs present in the data."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset()
+        df = pd.DataFrame(
+            {
+                "County": ["Dublin", "Dublin", "Cork", "Cork"],
+                "County ID": ["IE061", "IE061", "IE051", "IE051"],
+                "Year": [2021, 2020, 2021, 2020],
+                "value": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        with patch.object(
+            type(dataset),
+            "metadata",
+            new_callable=lambda: property(lambda self: {"time_variable": "Year"}),
+        ):
+            result = dataset._pivot_wide(df)
+
+        assert result["County"].tolist() == ["Dublin", "Cork"]
+        assert result["County ID"].tolist() == ["IE061", "IE051"]
+        assert list(result.columns) == ["County", "County ID", 2021, 2020]
+
 
 class TestPivotTidyDuplicateDetection:
     """Tests for duplicate detection in _pivot_tidy."""
@@ -1831,6 +1893,23 @@ class TestPivotTidyDuplicateDetection:
         with pytest.raises(ValidationError, match="Cannot pivot to tidy format: duplicate"):
             dataset._pivot_tidy(df)
 
+    def test_exact_duplicate_rows_are_dropped(self):
+        """Test that identical repeated rows pivot instead of raising."""
+        dataset = _make_offline_dataset()
+
+        df = pd.DataFrame(
+            {
+                "County": ["Dublin", "Dublin", "Cork"],
+                "Statistic": ["Population", "Population", "Population"],
+                "value": [100, 100, 200],
+            }
+        )
+
+        result = dataset._pivot_tidy(df)
+
+        assert result["County"].tolist() == ["Dublin", "Cork"]
+        assert result["Population"].tolist() == [100, 200]
+
     def test_no_statistic_column_raises(self):
         """Test that missing Statistic column raises ValidationError."""
         dataset = _make_offline_dataset()
@@ -1967,6 +2046,17 @@ class TestReprNonSpatial:
         repr_str = repr(dataset)
         assert "spatial=yes" in repr_str
 
+    def test_repr_shows_filters_without_loading(self):
+        """Test __repr__ shows filters and does not load the data."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset(filters={"Sex": ["Male"]})
+        with patch.object(CSODataset, "_load_raw_data") as mock_load:
+            repr_str = repr(dataset)
+
+        assert "filters={'Sex': ['Male']}" in repr_str
+        mock_load.assert_not_called()
+
 
 # =============================================================================
 # Tests for _normalise_filter_keys
@@ -2026,6 +2116,77 @@ class TestNormaliseFilterKeysUnit:
         result = dataset._normalise_filter_keys({"County": None})
         assert result["County"] is None
 
+    def test_apply_filters_uses_precomputed_normalisation(self):
+        """Test that filters are not re-normalised each time they are applied."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset(filters={"STATISTIC": ["Population"]})
+        df = pd.DataFrame({"Statistic": ["Population", "Area"], "value": [1, 2]})
+
+        with patch.object(CSODataset, "_normalise_filter_keys") as mock_normalise:
+            result = dataset._apply_filters(df)
+            dataset._drop_filter_columns(result)
+
+        mock_normalise.assert_not_called()
+        assert result["Statistic"].tolist() == ["Population"]
+
+
+# =============================================================================
+# Tests for _apply_filters
+# =============================================================================
+
+
+class TestApplyFiltersUnit:
+    """Unit tests for CSODataset._apply_filters."""
+
+    def test_string_filter_matches_numeric_column(self):
+        """Test that string filter values match non-string column values."""
+        dataset = _make_offline_dataset(filters={"Year": ["2022"]})
+        df = pd.DataFrame({"Year": [2021, 2022, 2022], "value": [1, 2, 3]})
+        result = dataset._apply_filters(df)
+        assert result["value"].tolist() == [2, 3]
+
+    def test_numeric_filter_matches_string_column(self):
+        """Test that numeric filter values match string column values."""
+        dataset = _make_offline_dataset(filters={"Year": [2022]})
+        df = pd.DataFrame({"Year": ["2021", "2022", "2022"], "value": [1, 2, 3]})
+        result = dataset._apply_filters(df)
+        assert result["value"].tolist() == [2, 3]
+
+    def test_no_match_raises(self):
+        """Test that a filter matching no rows raises ValidationError."""
+        dataset = _make_offline_dataset(filters={"County": ["Galway"]})
+        df = pd.DataFrame({"County": ["Dublin", "Cork"], "value": [1, 2]})
+        with pytest.raises(ValidationError, match="No matching values"):
+            dataset._apply_filters(df)
+
+    def test_multiple_filters_are_combined(self):
+        """Test that rows must satisfy every filter dimension."""
+        dataset = _make_offline_dataset(filters={"County": ["Dublin"], "Sex": ["Female"]})
+        df = pd.DataFrame(
+            {
+                "County": ["Dublin", "Dublin", "Cork"],
+                "Sex": ["Male", "Female", "Female"],
+                "value": [1, 2, 3],
+            }
+        )
+        result = dataset._apply_filters(df)
+        assert result["value"].tolist() == [2]
+        assert result.index.tolist() == [0]
+
+    def test_jointly_unmatched_filters_raise(self):
+        """Test that filters matching separately but not together raise."""
+        dataset = _make_offline_dataset(filters={"County": ["Cork"], "Sex": ["Male"]})
+        df = pd.DataFrame(
+            {
+                "County": ["Dublin", "Cork"],
+                "Sex": ["Male", "Female"],
+                "value": [1, 2],
+            }
+        )
+        with pytest.raises(ValidationError, match="No matching values for filter Sex"):
+            dataset._apply_filters(df)
+
 
 # =============================================================================
 # Tests for _drop_filter_columns edge cases
@@ -2125,6 +2286,97 @@ class TestNormaliseDataFrameUnit:
         assert "County" in result.columns
 
 
+# =============================================================================
+# Tests for pivot caching
+# =============================================================================
+
+
+class TestPivotCaching:
+    """Tests that pivoted frames are computed once per source and format."""
+
+    def test_df_wide_pivots_once(self):
+        """Test that repeated df('wide') calls reuse the cached pivot."""
+        from unittest.mock import patch
+
+        dataset = _make_offline_dataset()
+        dataset._cached_df = pd.DataFrame({"County": ["Dublin"], "value": [1]})
+        pivoted = pd.DataFrame({"County": ["Dublin"], "Population": [1]})
+
+        with patch.object(CSODataset, "_pivot_wide", return_value=pivoted) as mock_pivot:
+            first = dataset.df("wide")
+            second = dataset.df("wide")
+
+        mock_pivot.assert_called_once()
+        pd.testing.assert_frame_equal(first, second)
+        assert first is not second  # copies are still returned by default
+
+    def test_formats_and_sources_cached_separately(self):
+        """Test that wide/tidy and df/gdf pivots do not share cache entries."""
+        dataset = _make_offline_dataset()
+        dataset._cached_pivots[("df", PivotFormat.WIDE)] = pd.DataFrame({"a": [1]})
+        dataset._cached_pivots[("gdf", PivotFormat.WIDE)] = pd.DataFrame({"b": [1]})
+        dataset._cached_pivots[("gdf_ungeneralised", PivotFormat.TIDY)] = pd.DataFrame()
+
+        dataset._clear_cached_pivots("gdf_ungeneralised")
+
+        assert set(dataset._cached_pivots) == {("df", PivotFormat.WIDE), ("gdf", PivotFormat.WIDE)}
+
+
+# =============================================================================
+# Tests for _sanitise_dataframe
+# =============================================================================
+
+
+class TestSanitiseDataFrameUnit:
+    """Unit tests for CSODataset._sanitise_dataframe."""
+
+    def test_sanitises_repeated_dimension_values(self):
+        """Test that every occurrence of a label is sanitised consistently."""
+        dataset = _make_offline_dataset()
+        df = pd.DataFrame(
+            {
+                "Counties & Cities": ["Dublin  City.", "Cork /  Kerry", "Dublin  City.", None],
+                "value": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        result = dataset._sanitise_dataframe(df)
+        assert list(result.columns) == ["County and City", "value"]
+        assert result["County and City"].tolist()[:3] == [
+            "Dublin City",
+            "Cork/Kerry",
+            "Dublin City",
+        ]
+        assert pd.isna(result["County and City"].iloc[3])
+
+    def test_preserves_non_string_values_in_object_columns(self):
+        """Test that non-string values in object columns are left unchanged."""
+        dataset = _make_offline_dataset()
+        df = pd.DataFrame({"Year": pd.Series(["2020 ", 2021], dtype=object), "value": [1, 2]})
+        result = dataset._sanitise_dataframe(df)
+        assert result["Year"].tolist() == ["2020", 2021]
+
+    def test_value_column_untouched(self):
+        """Test that the value column is not sanitised."""
+        dataset = _make_offline_dataset()
+        df = pd.DataFrame({"County": ["Dublin"], "value": pd.Series(["1 "], dtype=object)})
+        result = dataset._sanitise_dataframe(df)
+        assert result["value"].iloc[0] == "1 "
+
+    def test_sanitises_extension_string_columns_only(self):
+        """Test that StringDtype columns are sanitised and numeric ones skipped."""
+        dataset = _make_offline_dataset()
+        df = pd.DataFrame(
+            {
+                "Sex": pd.array(["Both  sexes."], dtype="string"),
+                "Year": [2020],
+                "value": [1.0],
+            }
+        )
+        result = dataset._sanitise_dataframe(df)
+        assert result["Sex"].iloc[0] == "Both sexes"
+        assert result["Year"].iloc[0] == 2020
+
+
 # =============================================================================
 # Tests for gdf() caching with force_reload
 # =============================================================================
@@ -2149,7 +2401,7 @@ class TestGdfForceReload:
         )
         dataset._cached_gdf_ungeneralised = fake_gdf  # Already cached
 
-        with patch("pycsodata.dataset.create_ungeneralised_geodataframe") as mock_create:
+        with patch("pycsodata.ungeneralised.create_ungeneralised_geodataframe") as mock_create:
             rebuilt_gdf = gpd.GeoDataFrame(
                 {"County": ["Dublin"], "value": [2]},
                 geometry=[Point(0, 0)],
@@ -56,7 +56,7 @@ class TestFlushCache:
 class TestFetchJson:
     """Tests for the fetch_json function."""
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_successful_fetch(self, mock_get):
         """Test successful JSON fetch."""
         mock_response = Mock()
@@ -70,7 +70,7 @@ class TestFetchJson:
         result = fetch_json("http://example.com/data.json")
         assert result == {"data": "test"}
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_raises_api_error_on_failure(self, mock_get):
         """Test that APIError is raised on request failure."""
         import requests as req
@@ -82,7 +82,7 @@ class TestFetchJson:
         with pytest.raises(APIError):
             fetch_json("http://example.com/data.json")
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_retries_on_failure(self, mock_get):
         """Test that requests are retried on failure."""
         import requests as req
@@ -149,7 +149,7 @@ class TestLoadDataset:
 class TestFetchJsonImpl:
     """Tests for the _fetch_json_impl function (without caching)."""
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_timeout_error_retries(self, mock_get):
         """Test that timeout errors are retried."""
         mock_response = Mock()
@@ -167,7 +167,7 @@ class TestFetchJsonImpl:
         assert result == {"data": "test"}
         assert mock_get.call_count == 3
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_connection_error_retries(self, mock_get):
         """Test that connection errors are retried."""
         mock_response = Mock()
@@ -182,7 +182,7 @@ class TestFetchJsonImpl:
         result = _fetch_json_impl("http://example.com/test", retries=2)
         assert result == {"data": "test"}
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_http_client_error_not_retried(self, mock_get):
         """Test that 4xx HTTP errors are not retried."""
         mock_response = Mock()
@@ -199,7 +199,7 @@ class TestFetchJsonImpl:
         assert mock_get.call_count == 1
         assert exc_info.value.status_code == 404
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_http_server_error_retried(self, mock_get):
         """Test that 5xx HTTP errors are retried."""
         mock_fail_response = Mock()
@@ -217,7 +217,7 @@ class TestFetchJsonImpl:
         result = _fetch_json_impl("http://example.com/test", retries=2)
         assert result == {"data": "test"}
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_all_retries_exhausted(self, mock_get):
         """Test that APIError is raised when all retries exhausted."""
         mock_get.side_effect = requests.exceptions.Timeout("Timeout")
@@ -227,7 +227,7 @@ class TestFetchJsonImpl:
 
         assert mock_get.call_count == 3
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     def test_general_request_exception(self, mock_get):
         """Test handling of general RequestException."""
         mock_get.side_effect = requests.exceptions.RequestException("General error")
@@ -235,7 +235,7 @@ class TestFetchJsonImpl:
         with pytest.raises(APIError):
             _fetch_json_impl("http://example.com/test", retries=2)
 
-    @patch("pycsodata.fetchers.requests.get")
+    @patch("pycsodata.fetchers._session.get")
     @patch("pycsodata.fetchers.time.sleep")
     def test_exponential_backoff(self, mock_sleep, mock_get):
         """Test that exponential backoff is applied between retries."""
@@ -254,6 +254,57 @@ class TestFetchJsonImpl:
 
         # Check that sleep was called with increasing delays
         assert mock_sleep.call_count == 2
+        first, second = (call.args[0] for call in mock_sleep.call_args_list)
+        assert 0.4 <= first <= 0.6
+        assert 0.8 <= second <= 1.2
+
+    def test_backoff_delay_is_capped(self):
+        """Test that backoff delays stop growing after the precomputed schedule."""
+        from pycsodata.fetchers import _BACKOFF_DELAYS, _backoff_delay
+
+        assert _backoff_delay(100) <= _BACKOFF_DELAYS[-1] * 1.2
+
+    def test_decode_json_uses_orjson_for_bytes(self):
+        """Test that byte bodies are decoded without calling response.json()."""
+        pytest.importorskip("orjson")
+        from pycsodata.fetchers import _decode_json
+
+        response = Mock()
+        response.content = b'{"data": "t\xc3\xa9st"}'
+
+        assert _decode_json(response) == {"data": "t\u00e9st"}
+        response.json.assert_not_called()
+
+    def test_decode_json_falls_back_without_orjson(self, monkeypatch):
+        """Test that response.json() is used when orjson is unavailable."""
+        from pycsodata import fetchers
+
+        monkeypatch.setattr(fetchers, "orjson", None)
+        response = Mock()
+        response.content = b'{"data": "test"}'
+        response.json.return_value = {"data": "test"}
+
+        assert fetchers._decode_json(response) == {"data": "test"}
+        response.json.assert_called_once()
+
+    def test_decode_json_invalid_body_raises_requests_error(self):
+        """Test that malformed bodies raise the requests JSONDecodeError."""
+        from pycsodata.fetchers import _decode_json
+
+        response = requests.Response()
+        response._content = b"not json"
+        response.encoding = "utf-8"
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            _decode_json(response)
+
+    def test_shared_session_pools_without_adapter_retries(self):
+        """Test that requests share one pooled session that leaves retries to us."""
+        from pycsodata import fetchers
+
+        assert isinstance(fetchers._session, requests.Session)
+        adapter = fetchers._session.get_adapter("https://ws.cso.ie/")
+        assert adapter.max_retries.total == 0
 
 
 class TestFetchJsonCaching:
@@ -318,6 +369,22 @@ class TestLoadMetadataErrorHandling:
         with pytest.raises(APIError, match="Failed to load metadata"):
             load_metadata("TEST_CODE")
 
+    @patch("pycsodata.fetchers._session.get")
+    def test_404_fails_after_single_request(self, mock_get):
+        """Test that an unknown table code is reported without retrying."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "404 Not Found", response=mock_response
+        )
+        mock_get.return_value = mock_response
+
+        with pytest.raises(APIError, match="'NOPE01' not found") as exc_info:
+            load_metadata("NOPE01", cache=False)
+
+        assert mock_get.call_count == 1
+        assert exc_info.value.status_code == 404
+
 
 class TestLoadDatasetErrorHandling:
     """Tests for load_dataset error handling."""
@@ -388,3 +455,104 @@ class TestCacheThreadSafety:
 
         assert len(errors) == 0
         assert len(results) == 500  # 5 threads * 100 iterations
+
+    def test_disk_io_happens_outside_cache_lock(self):
+        """Test that disk cache scans do not hold the in-memory cache lock."""
+        from pycsodata import fetchers
+
+        lock_states = []
+
+        def record_lock_state(*args, **kwargs):
+            lock_states.append(fetchers._cache_lock.locked())
+            return 0
+
+        with (
+            patch("pycsodata.fetchers._disk_cache_size", side_effect=record_lock_state),
+            patch("pycsodata.fetchers._disk_cache_clear", side_effect=record_lock_state),
+        ):
+            get_cache_info()
+            flush_cache()
+
+        assert lock_states == [False, False]
+
+
+class TestDiskCache:
+    """Tests for the opt-in persistent disk cache."""
+
+    @pytest.fixture
+    def disk_cache_dir(self, tmp_path, monkeypatch):
+        """Enable the disk cache in a temporary directory."""
+        monkeypatch.setenv("PYCSODATA_DISK_CACHE", "1")
+        monkeypatch.setenv("PYCSODATA_CACHE_DIR", str(tmp_path))
+        flush_cache()
+        yield tmp_path / "http"
+        flush_cache()
+
+    @patch("pycsodata.fetchers._fetch_json_impl")
+    def test_disabled_by_default(self, mock_impl, tmp_path, monkeypatch):
+        """Test that nothing is written to disk unless enabled."""
+        monkeypatch.delenv("PYCSODATA_DISK_CACHE", raising=False)
+        monkeypatch.setenv("PYCSODATA_CACHE_DIR", str(tmp_path))
+        mock_impl.return_value = {"data": "test"}
+        flush_cache()
+
+        fetch_json("http://example.com/data")
+
+        assert not (tmp_path / "http").exists()
+        assert get_cache_info()["disk_size"] == 0
+
+    @patch("pycsodata.fetchers._fetch_json_impl")
+    def test_serves_from_disk_after_memory_cleared(self, mock_impl, disk_cache_dir):
+        """Test that persisted responses survive loss of the in-memory cache."""
+        from pycsodata import fetchers
+
+        mock_impl.return_value = {"data": "test"}
+
+        fetch_json("http://example.com/data")
+        assert get_cache_info()["disk_size"] == 1
+
+        # Simulate a fresh process
+        fetchers._http_cache.clear()
+
+        assert fetch_json("http://example.com/data") == {"data": "test"}
+        assert mock_impl.call_count == 1
+        assert get_cache_info()["size"] == 1
+
+    @patch("pycsodata.fetchers._fetch_json_impl")
+    def test_flush_clears_disk(self, mock_impl, disk_cache_dir):
+        """Test that flush_cache removes persisted responses."""
+        mock_impl.return_value = {"data": "test"}
+
+        fetch_json("http://example.com/data")
+        flush_cache()
+
+        assert get_cache_info()["disk_size"] == 0
+        assert not list(disk_cache_dir.glob("*.json"))
+
+    @patch("pycsodata.fetchers._fetch_json_impl")
+    def test_expired_entries_are_refetched(self, mock_impl, disk_cache_dir):
+        """Test that entries older than the TTL are ignored."""
+        import os
+
+        from pycsodata import fetchers
+        from pycsodata.constants import CACHE_TTL_SECONDS
+
+        mock_impl.return_value = {"data": "test"}
+        fetch_json("http://example.com/data")
+
+        (path,) = disk_cache_dir.glob("*.json")
+        stale = path.stat().st_mtime - CACHE_TTL_SECONDS - 1
+        os.utime(path, (stale, stale))
+        fetchers._http_cache.clear()
+
+        fetch_json("http://example.com/data")
+        assert mock_impl.call_count == 2
+
+    @patch("pycsodata.fetchers._fetch_json_impl")
+    def test_cache_false_bypasses_disk(self, mock_impl, disk_cache_dir):
+        """Test that cache=False neither reads nor writes the disk cache."""
+        mock_impl.return_value = {"data": "test"}
+
+        fetch_json("http://example.com/data", cache=False)
+
+        assert get_cache_info()["disk_size"] == 0
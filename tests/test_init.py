@@ -1,5 +1,7 @@
 """Tests for the public API exposed by __init__.py."""
 
+import pytest
+
 from pycsodata import (
     APIError,
     CacheInfo,
@@ -56,28 +58,36 @@ class TestPublicImports:
         assert ValidationError is not None
 
 
+@pytest.fixture(scope="module")
+def cso_cache() -> CSOCache:
+    """A CSOCache handle shared by the module; it holds no state of its own."""
+    return CSOCache()
+
+
+@pytest.fixture
+def flushed_cache(cso_cache: CSOCache) -> CSOCache:
+    """The shared handle with the underlying response cache flushed."""
+    cso_cache.flush()
+    return cso_cache
+
+
 class TestCSOCacheAPI:
     """Tests for the CSOCache API exposed at module level."""
 
-    def test_csocache_flush(self):
+    def test_csocache_flush(self, cso_cache):
         """Test that CSOCache.flush() works."""
-        cache = CSOCache()
-        cache.flush()
-        info = cache.info()
+        cso_cache.flush()
+        info = cso_cache.info()
         assert info.size == 0
 
-    def test_csocache_info_returns_cacheinfo(self):
+    def test_csocache_info_returns_cacheinfo(self, flushed_cache):
         """Test that CSOCache.info() returns CacheInfo."""
-        cache = CSOCache()
-        cache.flush()
-        info = cache.info()
+        info = flushed_cache.info()
         assert isinstance(info, CacheInfo)
 
-    def test_csocache_info_has_expected_attributes(self):
+    def test_csocache_info_has_expected_attributes(self, flushed_cache):
         """Test that CacheInfo has expected attributes."""
-        cache = CSOCache()
-        cache.flush()
-        info = cache.info()
+        info = flushed_cache.info()
         assert hasattr(info, "size")
         assert hasattr(info, "maxsize")
         assert hasattr(info, "ttl_seconds")
@@ -136,8 +146,8 @@ class TestModuleAllExports:
             "ValidationError",
         ]
 
-        for export in expected_exports:
-            assert hasattr(pycsodata, export), f"Missing export: {export}"
+        missing = set(expected_exports) - set(vars(pycsodata))
+        assert not missing, f"Missing exports: {sorted(missing)}"
 
     def test_all_list_complete(self):
         """Test that __all__ list contains expected items."""
@@ -167,3 +177,22 @@ class TestModuleDocstring:
         assert pycsodata.__doc__ is not None
         assert "CSODataset" in pycsodata.__doc__
         assert "example" in pycsodata.__doc__.lower() or "Example" in pycsodata.__doc__
+
+
+class TestLazySpatialImports:
+    """Tests that spatial dependencies are only imported when needed."""
+
+    def test_import_does_not_load_geopandas(self):
+        """Test that importing pycsodata does not import geopandas or shapely."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, pycsodata; "
+            "print(any(m in sys.modules for m in "
+            "('geopandas', 'shapely', 'pycsodata.spatial', 'pycsodata.ungeneralised')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
@@ -1,16 +1,23 @@
 """Tests for the parsers module."""
 
+from datetime import date
+
 import pandas as pd
+import pytest
 
 from pycsodata._types import SpatialInfo
+from pycsodata.constants import MISENCODED_CHARACTER_MAP, STATISTIC_LABELS
 from pycsodata.parsers import (
+    _STATISTIC_DIMENSION_KEYS,
     _build_tags,
+    _detect_time_format,
     _extract_time_variable,
     _extract_units,
     _get_statistic_dimension,
     _process_notes,
     extract_id_mapping,
     extract_spatial_info,
+    json_stat_to_dataframe,
     parse_metadata,
     parse_temporal_column,
     repair_json,
@@ -30,16 +37,22 @@ class TestRepairText:
         assert repair_text("╔ire") == "Éire"
         assert repair_text("Θire") == "éire"
 
-    def test_repairs_acute_accents(self):
+    @pytest.mark.parametrize(
+        ("bad", "good"),
+        [
+            ("┴", "Á"),
+            ("ß", "á"),
+            ("╔", "É"),
+            ("Θ", "é"),
+            ("φ", "í"),
+            ("╙", "Ó"),
+            ("≤", "ó"),
+            ("·", "ú"),
+        ],
+    )
+    def test_repairs_acute_accents(self, bad, good):
         """Test all acute accent repairs."""
-        assert repair_text("┴") == "Á"
-        assert repair_text("ß") == "á"
-        assert repair_text("╔") == "É"
-        assert repair_text("Θ") == "é"
-        assert repair_text("φ") == "í"
-        assert repair_text("╙") == "Ó"
-        assert repair_text("≤") == "ó"
-        assert repair_text("·") == "ú"
+        assert repair_text(bad) == good
 
     def test_preserves_correct_text(self):
         """Test that correctly encoded text is unchanged."""
@@ -54,6 +67,15 @@ class TestRepairText:
         """Test text with both correct and incorrect encoding."""
         assert repair_text("Baile ┴tha Cliath") == "Baile Átha Cliath"
 
+    def test_ascii_text_returned_unchanged(self):
+        """Test that ASCII text is returned as the same object."""
+        text = "Dublin City"
+        assert repair_text(text) is text
+
+    def test_repair_targets_are_non_ascii(self):
+        """Test the ASCII fast path cannot skip a repairable character."""
+        assert not any(bad.isascii() for bad in MISENCODED_CHARACTER_MAP)
+
 
 class TestRepairJson:
     """Tests for the repair_json function."""
@@ -93,6 +115,23 @@ class TestRepairJson:
         assert repair_json({}) == {}
         assert repair_json([]) == []
 
+    def test_does_not_modify_input(self):
+        """Test that the input structure is left unchanged."""
+        data = {"name": "╔ire", "places": ["Θire", {"city": "Ceann·igh"}]}
+        fixed = repair_json(data)
+        assert data == {"name": "╔ire", "places": ["Θire", {"city": "Ceann·igh"}]}
+        assert fixed["places"][1] is not data["places"][1]
+
+    def test_handles_deep_nesting(self):
+        """Test that nesting deeper than the recursion limit is repaired."""
+        data: list = ["╔ire"]
+        for _ in range(5000):
+            data = [data]
+        fixed = repair_json(data)
+        for _ in range(5000):
+            fixed = fixed[0]
+        assert fixed == ["Éire"]
+
 
 class TestExtractSpatialInfo:
     """Tests for the extract_spatial_info function."""
@@ -199,6 +238,21 @@ class TestParseTemporalColumn:
         df = pd.DataFrame({"Year": ["2020", "2021", "2022"], "value": [1, 2, 3]})
         result = parse_temporal_column(df, "Year")
         assert result["Year"].tolist() == [2020, 2021, 2022]
+        assert pd.api.types.is_integer_dtype(result["Year"])
+
+    def test_year_format_coerces_invalid_values(self):
+        """Test that non-numeric entries in a year column become NaN."""
+        df = pd.DataFrame({"Year": ["2020", "n/a"], "value": [1, 2]})
+        result = parse_temporal_column(df, "Year")
+        assert result["Year"].iloc[0] == 2020
+        assert pd.isna(result["Year"].iloc[1])
+
+    def test_year_format_rejects_non_year_numbers(self):
+        """Test that numbers that are not four-digit years become NaN."""
+        df = pd.DataFrame({"Year": ["2020", "2019.5", "1e3", "20210"], "value": [1, 2, 3, 4]})
+        result = parse_temporal_column(df, "Year")
+        assert result["Year"].iloc[0] == 2020
+        assert result["Year"].iloc[1:].isna().all()
 
     def test_handles_missing_time_variable(self):
         """Test handling when time variable is not in DataFrame."""
@@ -219,81 +273,127 @@ class TestParseTemporalColumn:
         assert result.empty
 
 
-class TestParseTemporalColumnFormats:
-    """Tests for various temporal column formats."""
-
-    def test_parses_monthly_format_with_m(self):
-        """Test parsing of monthly format (2022M01)."""
-        df = pd.DataFrame({"Month": ["2022M01", "2022M02", "2022M03"], "value": [1, 2, 3]})
-        result = parse_temporal_column(df, "Month")
-
-        # Should be Period type with monthly frequency
-        assert hasattr(result["Month"].iloc[0], "freqstr") or str(result["Month"].dtype).startswith(
-            "period"
-        )
-
-    def test_parses_monthly_format_mixed(self):
-        """Test parsing of monthly format with mixed format."""
-        df = pd.DataFrame(
-            {"Month": ["January 2022", "February 2022", "March 2022"], "value": [1, 2, 3]}
-        )
-        result = parse_temporal_column(df, "Month")
+class TestDetectTimeFormat:
+    """Tests for the _detect_time_format helper."""
+
+    @pytest.mark.parametrize(
+        ("label", "sample", "expected"),
+        [
+            ("Census Year", "2022", "year"),
+            ("Month", "2022M01", "month_code"),
+            ("Month", "January 2022", "month"),
+            ("Quarter", "2022Q1", "quarter"),
+            ("Week", "2022W01", "week"),
+            ("Academic Year", "2022/2023", "skip"),
+            ("Academic Year (Ending)", "2022/2023", "skip"),
+            ("Date", "2022-01-15", "datetime"),
+        ],
+    )
+    def test_classifies_formats(self, label, sample, expected):
+        """Test classification from the column label and first value."""
+        assert _detect_time_format(label, sample) == expected
+
+    def test_results_are_memoised(self):
+        """Test that repeated detections are served from the cache."""
+        _detect_time_format.cache_clear()
+        _detect_time_format("Month", "2022M01")
+        _detect_time_format("Month", "2022M01")
+        assert _detect_time_format.cache_info().hits == 1
 
-        # Should be parsed as periods
-        assert len(result) == 3
 
-    def test_parses_quarterly_format(self):
-        """Test parsing of quarterly format."""
-        df = pd.DataFrame({"Quarter": ["2022Q1", "2022Q2", "2022Q3"], "value": [1, 2, 3]})
-        result = parse_temporal_column(df, "Quarter")
-
-        # Should be Period type with quarterly frequency
-        assert len(result) == 3
-
-    def test_parses_weekly_format(self):
-        """Test parsing of weekly format."""
-        df = pd.DataFrame({"Week": ["2022-01-01", "2022-01-08", "2022-01-15"], "value": [1, 2, 3]})
-        result = parse_temporal_column(df, "Week")
+class TestParseTemporalColumnFormats:
+    """Tests for various temporal column formats."""
 
-        # Should be date type
-        assert len(result) == 3
+    @pytest.mark.parametrize(
+        ("column", "values", "expected"),
+        [
+            ("Month", ["2022M01", "2022M02", "2022M03"], pd.Period("2022-01", "M")),
+            ("Month", ["January 2022", "February 2022", "March 2022"], pd.Period("2022-01", "M")),
+            ("Quarter", ["2022Q1", "2022Q2", "2022Q3"], pd.Period("2022Q1", "Q")),
+            ("Week", ["2022-01-01", "2022-01-08", "2022-01-15"], date(2022, 1, 1)),
+            ("Date", ["2022-01-15", "2022-02-15", "2022-03-15"], date(2022, 1, 15)),
+        ],
+    )
+    def test_parses_format(self, column, values, expected):
+        """Test that each supported format is converted to the expected type."""
+        df = pd.DataFrame({column: values, "value": range(len(values))})
+        result = parse_temporal_column(df, column)
+
+        assert len(result) == len(values)
+        assert result[column].iloc[0] == expected
+
+    @pytest.mark.parametrize(
+        ("column", "values"),
+        [
+            ("Influenza Season", ["2021/2022", "2022/2023"]),
+            ("Academic Year", ["2021/2022", "2022/2023"]),
+            ("Halfyear Period", ["2022H1", "2022H2"]),
+        ],
+    )
+    def test_skips_non_standard_format(self, column, values):
+        """Test that non-standard time formats are left unchanged."""
+        df = pd.DataFrame({column: values, "value": range(len(values))})
+        result = parse_temporal_column(df, column)
+
+        assert result[column].tolist() == values
 
-    def test_skips_influenza_season(self):
-        """Test that influenza season is skipped."""
-        df = pd.DataFrame({"Influenza Season": ["2021/2022", "2022/2023"], "value": [1, 2]})
-        result = parse_temporal_column(df, "Influenza Season")
+    def test_handles_none_dataframe(self):
+        """Test handling of None DataFrame."""
+        result = parse_temporal_column(None, "Year")  # type: ignore
+        assert result is None
 
-        # Should be unchanged (strings)
-        assert result["Influenza Season"].tolist() == ["2021/2022", "2022/2023"]
 
-    def test_skips_academic_year(self):
-        """Test that academic year is skipped."""
-        df = pd.DataFrame({"Academic Year": ["2021/2022", "2022/2023"], "value": [1, 2]})
-        result = parse_temporal_column(df, "Academic Year")
+class TestJsonStatToDataFrame:
+    """Tests for the json_stat_to_dataframe function."""
 
-        # Should be unchanged
-        assert result["Academic Year"].tolist() == ["2021/2022", "2022/2023"]
+    @staticmethod
+    def _dataset(value):
+        """Build a small FY003A-style JSON-stat dataset with the given values."""
+        return {
+            "version": "2.0",
+            "class": "dataset",
+            "id": ["STATISTIC", "TLIST(A1)", "C02199V02655"],
+            "size": [1, 2, 2],
+            "dimension": {
+                "STATISTIC": {
+                    "label": "Statistic",
+                    "category": {"index": ["FY003A"], "label": {"FY003A": "Population"}},
+                },
+                "TLIST(A1)": {
+                    "label": "CensusYear",
+                    "category": {"index": {"2022": 1, "2016": 0}},
+                },
+                "C02199V02655": {
+                    "label": "Sex",
+                    "category": {"index": ["1", "2"], "label": {"1": "Male", "2": "Female"}},
+                },
+            },
+            "value": value,
+        }
 
-    def test_skips_halfyear(self):
-        """Test that halfyear is skipped."""
-        df = pd.DataFrame({"Halfyear Period": ["2022H1", "2022H2"], "value": [1, 2]})
-        result = parse_temporal_column(df, "Halfyear Period")
+    def test_decodes_in_row_major_order(self):
+        """Test that the last dimension varies fastest, following category index order."""
+        df = json_stat_to_dataframe(self._dataset([1, 2, 3, 4]))
 
-        # Should be unchanged
-        assert result["Halfyear Period"].tolist() == ["2022H1", "2022H2"]
+        assert list(df.columns) == ["Statistic", "CensusYear", "Sex", "value"]
+        assert df["CensusYear"].tolist() == ["2016", "2016", "2022", "2022"]
+        assert df["Sex"].tolist() == ["Male", "Female", "Male", "Female"]
+        assert df["Statistic"].tolist() == ["Population"] * 4
+        assert df["value"].tolist() == [1, 2, 3, 4]
 
-    def test_parses_date_without_time(self):
-        """Test parsing of date without time component."""
-        df = pd.DataFrame({"Date": ["2022-01-15", "2022-02-15", "2022-03-15"], "value": [1, 2, 3]})
-        result = parse_temporal_column(df, "Date")
+    def test_sparse_values_filled_with_missing(self):
+        """Test that sparse value mappings are expanded to every observation."""
+        df = json_stat_to_dataframe(self._dataset({"0": 10, "3": 40}))
 
-        # Should be date type
-        assert len(result) == 3
+        assert len(df) == 4
+        assert df["value"].iloc[0] == 10
+        assert df["value"].iloc[3] == 40
+        assert df["value"].iloc[1:3].isna().all()
 
-    def test_handles_none_dataframe(self):
-        """Test handling of None DataFrame."""
-        result = parse_temporal_column(None, "Year")  # type: ignore
-        assert result is None
+    def test_value_count_mismatch_raises(self):
+        """Test that a dense value list of the wrong length is rejected."""
+        with pytest.raises(ValueError, match="3 values"):
+            json_stat_to_dataframe(self._dataset([1, 2, 3]))
 
 
 class TestGetStatisticDimension:
@@ -329,6 +429,16 @@ class TestGetStatisticDimension:
         result = _get_statistic_dimension(dimensions)
         assert result == {}
 
+    def test_prefers_uppercase_when_both_present(self):
+        """Test that the lookup order is fixed when both casings exist."""
+        dimensions = {"Statistic": {"label": "lower"}, "STATISTIC": {"label": "upper"}}
+        result = _get_statistic_dimension(dimensions)
+        assert result == {"label": "upper"}
+
+    def test_lookup_keys_cover_statistic_labels(self):
+        """Test the ordered lookup keys match STATISTIC_LABELS."""
+        assert set(_STATISTIC_DIMENSION_KEYS) == STATISTIC_LABELS
+
 
 class TestExtractUnits:
     """Tests for _extract_units function."""
@@ -431,6 +541,12 @@ class TestProcessNotes:
         url_end = result[0].find(".com", url_start) + 4
         assert result[0][url_start:url_end] == "http://example.com"
 
+    def test_removes_bold_tags_and_collapses_spaces(self):
+        """Test removal of [b] tags together with surrounding whitespace."""
+        notes = ["  A [b]bold[/b]\n\nnote  "]
+        result = _process_notes(notes)
+        assert result == ["A bold note"]
+
     def test_skips_empty_notes(self):
         """Test that empty notes are skipped."""
         notes = ["", "Valid note", None, "Another note"]
@@ -1,20 +1,80 @@
 """Tests for the printer module."""
 
+import io
 from datetime import datetime
 
+import pytest
+
 from pycsodata._types import DatasetMetadata
 from pycsodata.printer import MetadataPrinter
 
+# Shared inputs; MetadataPrinter never mutates the metadata it is given
+_LAST_UPDATED = datetime(2023, 6, 15)
+_BASIC_METADATA = DatasetMetadata(table_code="FY003A", title="Test Dataset")
+
+
+def _assert_contains_all(text: str, *needles: str) -> None:
+    """Assert that every needle occurs in text, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"Missing from output: {missing}"
+
+
+def _render(
+    metadata: DatasetMetadata,
+    method: str = "print_all",
+    filters: dict | None = None,
+    drop_filtered_cols: bool = False,
+) -> str:
+    """Call one printer method with output captured in a buffer, returning the text."""
+    buffer = io.StringIO()
+    printer = MetadataPrinter(metadata, filters, drop_filtered_cols, file=buffer)
+    getattr(printer, method)()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def buffer() -> io.StringIO:
+    """A fresh text buffer for printer output."""
+    return io.StringIO()
+
+
+@pytest.fixture
+def empty_printer(buffer: io.StringIO) -> MetadataPrinter:
+    """A printer over empty metadata that writes to the buffer fixture."""
+    return MetadataPrinter(DatasetMetadata(), file=buffer)
+
+
+@pytest.fixture(scope="module")
+def full_output() -> str:
+    """print_all() output for fully populated metadata, rendered once per module."""
+    metadata = DatasetMetadata(
+        table_code="FY003A",
+        title="Test Dataset",
+        variables=["County", "STATISTIC", "Census Year"],
+        statistics=["Population"],
+        units=["Number"],
+        tags=["Official Statistics", "Geographic Data"],
+        time_variable="Census Year",
+        geographic=True,
+        spatial_key="County",
+        last_updated=_LAST_UPDATED,
+        reasons=["Data revision"],
+        notes=["A note about the dataset."],
+        contact_name="John Doe",
+        contact_email="john@example.com",
+        contact_phone="+353 1 234 5678",
+        copyright_name="Central Statistics Office",
+        copyright_href="https://www.cso.ie",
+    )
+    return _render(metadata)
+
 
 class TestMetadataPrinter:
     """Tests for the MetadataPrinter class."""
 
     def test_initialisation(self):
         """Test MetadataPrinter initialises correctly."""
-        metadata = DatasetMetadata(
-            table_code="FY003A",
-            title="Test Dataset",
-        )
+        metadata = _BASIC_METADATA
         printer = MetadataPrinter(metadata)
         assert printer.meta == metadata
         assert printer.filters == {}
@@ -27,6 +87,15 @@ class TestMetadataPrinter:
         printer = MetadataPrinter(metadata, filters)
         assert printer.filters == filters
 
+    def test_writes_to_given_file(self, capsys):
+        """Test that output goes to the file argument instead of stdout."""
+        buffer = io.StringIO()
+        printer = MetadataPrinter(DatasetMetadata(table_code="FY003A"), file=buffer)
+        printer._print_header()
+
+        assert "FY003A" in buffer.getvalue()
+        assert capsys.readouterr().out == ""
+
     def test_normalise_filter_keys_statistic(self):
         """Test that STATISTIC is normalised to Statistic."""
         filters: dict = {"STATISTIC": ["Population"]}
@@ -47,7 +116,7 @@ class TestMetadataPrinter:
         assert "County" in normalised
 
     def test_print_all_outputs_to_stdout(self, capsys):
-        """Test that print_all outputs to stdout."""
+        """Test that print_all writes to stdout when no file is given."""
         metadata = DatasetMetadata(
             table_code="FY003A",
             title="Test Dataset",
@@ -62,117 +131,22 @@ class TestMetadataPrinter:
         assert "FY003A" in captured.out
         assert "Test Dataset" in captured.out
 
-    def test_print_header_outputs_code_and_title(self, capsys):
-        """Test that header prints code and title."""
-        metadata = DatasetMetadata(
-            table_code="FY003A",
-            title="Test Dataset",
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_header()
-
-        captured = capsys.readouterr()
-        assert "Code:" in captured.out
-        assert "FY003A" in captured.out
-        assert "Title:" in captured.out
-        assert "Test Dataset" in captured.out
-
-    def test_print_variables_outputs_variables(self, capsys):
-        """Test that variables are printed."""
-        metadata = DatasetMetadata(
-            variables=["County", "Year", "Sex"],
-            statistics=[],
-            units=[],
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_variables()
-
-        captured = capsys.readouterr()
-        assert "Variables:" in captured.out
-        assert "County" in captured.out
-        assert "Year" in captured.out
-        assert "Sex" in captured.out
-
-    def test_print_tags_outputs_tags(self, capsys):
-        """Test that tags are printed."""
-        metadata = DatasetMetadata(
-            tags=["census", "population", "demographic"],
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_tags()
-
-        captured = capsys.readouterr()
-        assert "Tags:" in captured.out
-        assert "census" in captured.out
-        assert "population" in captured.out
-
-    def test_print_tags_handles_empty_tags(self, capsys):
-        """Test that empty tags shows None."""
-        metadata = DatasetMetadata(tags=[])
-        printer = MetadataPrinter(metadata)
-        printer._print_tags()
-
-        captured = capsys.readouterr()
-        assert "None" in captured.out
-
-    def test_print_time_and_spatial_outputs_time_variable(self, capsys):
-        """Test that time variable is printed."""
-        metadata = DatasetMetadata(
-            time_variable="Census Year",
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_time_and_spatial()
-
-        captured = capsys.readouterr()
-        assert "Time Variable:" in captured.out
-        assert "Census Year" in captured.out
-
-    def test_print_updated_outputs_date(self, capsys):
-        """Test that last updated date is printed."""
-        metadata = DatasetMetadata(
-            last_updated=datetime(2023, 6, 15),
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_updated()
-
-        captured = capsys.readouterr()
-        assert "Last Updated:" in captured.out
-        assert "2023-06-15" in captured.out
-
-    def test_print_contact_outputs_contact_info(self, capsys):
-        """Test that contact information is printed."""
-        metadata = DatasetMetadata(
-            contact_name="John Doe",
-            contact_email="john@example.com",
-            contact_phone="+353 1 234 5678",
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_contact()
-
-        captured = capsys.readouterr()
-        assert "Contact Name:" in captured.out
-        assert "John Doe" in captured.out
-        assert "Contact Email:" in captured.out
-        assert "john@example.com" in captured.out
-
-    def test_print_copyright_outputs_copyright_info(self, capsys):
+    def test_print_copyright_outputs_copyright_info(self):
         """Test that copyright information is printed."""
         metadata = DatasetMetadata(
             copyright_name="Central Statistics Office",
             copyright_href="https://www.cso.ie",
         )
-        printer = MetadataPrinter(metadata)
-        printer._print_copyright()
+        output = _render(metadata, "_print_copyright")
 
-        captured = capsys.readouterr()
-        assert "Copyright:" in captured.out
-        assert "Central Statistics Office" in captured.out
+        assert "Copyright:" in output
+        assert "Central Statistics Office" in output
         # Parse the URL from the output and check it is correct
-        url_start = captured.out.find("http")
-        url_end = captured.out.find(")", url_start)
-        assert captured.out[url_start:url_end] == "https://www.cso.ie"
+        url_start = output.find("http")
+        url_end = output.find(")", url_start)
+        assert output[url_start:url_end] == "https://www.cso.ie"
 
-    def test_drop_filtered_cols_removes_variables(self, capsys):
+    def test_drop_filtered_cols_removes_variables(self):
         """Test that filtered variables are removed when drop_filtered_cols is True."""
         metadata = DatasetMetadata(
             variables=["County", "Year", "Sex"],
@@ -180,13 +154,11 @@ class TestMetadataPrinter:
             units=[],
         )
         filters: dict = {"County": ["Dublin"]}
-        printer = MetadataPrinter(metadata, filters=filters, drop_filtered_cols=True)
-        printer._print_variables()
+        output = _render(metadata, "_print_variables", filters=filters, drop_filtered_cols=True)
 
-        captured = capsys.readouterr()
-        assert "County" not in captured.out
-        assert "Year" in captured.out
-        assert "Sex" in captured.out
+        assert "County" not in output
+        assert "Year" in output
+        assert "Sex" in output
 
 
 class TestMetadataPrinterFormatting:
@@ -201,73 +173,28 @@ class TestMetadataPrinterFormatting:
         assert MetadataPrinter.LABEL_WIDTH == 20
 
 
-class TestMetadataPrinterNotes:
-    """Tests for notes printing."""
-
-    def test_print_notes_single_note(self, capsys):
-        """Test printing a single note."""
-        metadata = DatasetMetadata(notes=["This is a test note about the dataset."])
-        printer = MetadataPrinter(metadata)
-        printer._print_notes()
-
-        captured = capsys.readouterr()
-        assert "Notes:" in captured.out
-        assert "This is a test note" in captured.out
-
-    def test_print_notes_multiple_notes(self, capsys):
-        """Test printing multiple notes."""
-        metadata = DatasetMetadata(notes=["First note.", "Second note.", "Third note."])
-        printer = MetadataPrinter(metadata)
-        printer._print_notes()
-
-        captured = capsys.readouterr()
-        assert "First note." in captured.out
-        assert "Second note." in captured.out
-        assert "Third note." in captured.out
-
-    def test_print_notes_empty(self, capsys):
-        """Test printing when no notes."""
-        metadata = DatasetMetadata(notes=[])
-        printer = MetadataPrinter(metadata)
-        printer._print_notes()
-
-        captured = capsys.readouterr()
-        # Should not output anything for empty notes
-        assert "Notes:" not in captured.out
-
-    def test_print_notes_long_text_wraps(self, capsys):
-        """Test that long notes are wrapped."""
-        long_note = "This is a very long note " * 20
-        metadata = DatasetMetadata(notes=[long_note])
-        printer = MetadataPrinter(metadata)
-        printer._print_notes()
-
-        captured = capsys.readouterr()
-        # Output should contain the note text
-        assert "very long note" in captured.out
-
-
 class TestMetadataPrinterStatistics:
     """Tests for statistics printing within variables."""
 
-    def test_print_variables_with_statistics(self, capsys):
+    def test_print_variables_with_statistics(self):
         """Test printing variables that include statistics."""
         metadata = DatasetMetadata(
             variables=["County", "STATISTIC", "Year"],
             statistics=["Population", "Birth Rate"],
             units=["Number", "Rate per 1000"],
         )
-        printer = MetadataPrinter(metadata)
-        printer._print_variables()
-
-        captured = capsys.readouterr()
-        assert "Statistic" in captured.out
-        assert "Population" in captured.out
-        assert "Birth Rate" in captured.out
-        assert "Unit:" in captured.out
-        assert "Number" in captured.out
+        output = _render(metadata, "_print_variables")
+
+        _assert_contains_all(
+            output,
+            "Statistic",
+            "Population",
+            "Birth Rate",
+            "Unit:",
+            "Number",
+        )
 
-    def test_print_variables_with_filtered_statistics(self, capsys):
+    def test_print_variables_with_filtered_statistics(self):
         """Test printing variables with filtered statistics."""
         metadata = DatasetMetadata(
             variables=["County", "Statistic", "Year"],
@@ -275,187 +202,215 @@ class TestMetadataPrinterStatistics:
             units=["Number", "Rate per 1000", "Rate per 1000"],
         )
         filters: dict = {"Statistic": ["Population"]}
-        printer = MetadataPrinter(metadata, filters=filters)
-        printer._print_variables()
+        output = _render(metadata, "_print_variables", filters=filters)
 
-        captured = capsys.readouterr()
         # Should show only filtered statistics
-        assert "Population" in captured.out
+        assert "Population" in output
 
-    def test_print_variables_statistic_not_first(self, capsys):
+    def test_print_variables_statistic_not_first(self):
         """Test printing when Statistic is not the first variable."""
         metadata = DatasetMetadata(
             variables=["County", "Year", "STATISTIC"],
             statistics=["Population"],
             units=["Number"],
         )
-        printer = MetadataPrinter(metadata)
-        printer._print_variables()
-
-        captured = capsys.readouterr()
-        assert "County" in captured.out
-        assert "Year" in captured.out
-
-
-class TestMetadataPrinterSpatial:
-    """Tests for spatial information printing."""
-
-    def test_print_spatial_info(self, capsys):
-        """Test printing geographic variable info."""
-        metadata = DatasetMetadata(geographic=True, spatial_key="County")
-        printer = MetadataPrinter(metadata)
-        printer._print_time_and_spatial()
-
-        captured = capsys.readouterr()
-        assert "Geographic Variable:" in captured.out
-        assert "County" in captured.out
-
-    def test_print_no_spatial_info(self, capsys):
-        """Test printing when no geographic data."""
-        metadata = DatasetMetadata(geographic=False)
-        printer = MetadataPrinter(metadata)
-        printer._print_time_and_spatial()
-
-        captured = capsys.readouterr()
-        assert "Geographic Variable:" not in captured.out
-
-
-class TestMetadataPrinterUpdated:
-    """Tests for update information printing."""
-
-    def test_print_updated_with_reasons(self, capsys):
-        """Test printing update info with reasons."""
-        metadata = DatasetMetadata(
-            last_updated=datetime(2023, 6, 15), reasons=["Monthly update", "Data revision"]
-        )
-        printer = MetadataPrinter(metadata)
-        printer._print_updated()
-
-        captured = capsys.readouterr()
-        assert "2023-06-15" in captured.out
-        assert "Reason for Release:" in captured.out
-        assert "Monthly update" in captured.out
-
-    def test_print_updated_no_date(self, capsys):
-        """Test printing when no update date."""
-        metadata = DatasetMetadata(last_updated=None)
-        printer = MetadataPrinter(metadata)
-        printer._print_updated()
-
-        captured = capsys.readouterr()
-        assert "Last Updated:" not in captured.out
-
-
-class TestMetadataPrinterContactExtended:
-    """Additional tests for contact information printing."""
-
-    def test_print_contact_partial(self, capsys):
-        """Test printing partial contact info."""
-        metadata = DatasetMetadata(contact_name="John Doe", contact_email=None, contact_phone=None)
-        printer = MetadataPrinter(metadata)
-        printer._print_contact()
-
-        captured = capsys.readouterr()
-        assert "Contact Name:" in captured.out
-        assert "John Doe" in captured.out
-        assert "Contact Email:" not in captured.out
-
-    def test_print_contact_with_phone(self, capsys):
-        """Test printing contact info with phone."""
-        metadata = DatasetMetadata(contact_name="John Doe", contact_phone="+353 1 234 5678")
-        printer = MetadataPrinter(metadata)
-        printer._print_contact()
-
-        captured = capsys.readouterr()
-        assert "Contact Phone:" in captured.out
-        assert "+353 1 234 5678" in captured.out
-
-
-class TestMetadataPrinterCopyrightExtended:
-    """Additional tests for copyright information printing."""
-
-    def test_print_copyright_without_href(self, capsys):
-        """Test printing copyright without URL."""
-        metadata = DatasetMetadata(copyright_name="Central Statistics Office", copyright_href=None)
-        printer = MetadataPrinter(metadata)
-        printer._print_copyright()
-
-        captured = capsys.readouterr()
-        assert "Copyright:" in captured.out
-        assert "Central Statistics Office" in captured.out
-        assert "(" not in captured.out  # No URL parentheses
-
-    def test_print_copyright_empty(self, capsys):
-        """Test printing when no copyright info."""
-        metadata = DatasetMetadata(copyright_name=None, copyright_href=None)
-        printer = MetadataPrinter(metadata)
-        printer._print_copyright()
-
-        captured = capsys.readouterr()
-        assert "Copyright:" not in captured.out
+        output = _render(metadata, "_print_variables")
+
+        assert "County" in output
+        assert "Year" in output
+
+
+# (fields, method, expected, unexpected) for one section printed from DatasetMetadata(**fields)
+_PRINT_CASES = [
+    pytest.param(
+        {"table_code": "FY003A", "title": "Test Dataset"},
+        "_print_header",
+        ("Code:", "FY003A", "Title:", "Test Dataset"),
+        (),
+        id="header",
+    ),
+    pytest.param(
+        {"variables": ["County", "Year", "Sex"], "statistics": [], "units": []},
+        "_print_variables",
+        ("Variables:", "County", "Year", "Sex"),
+        (),
+        id="variables",
+    ),
+    pytest.param(
+        {"tags": ["census", "population", "demographic"]},
+        "_print_tags",
+        ("Tags:", "census", "population"),
+        (),
+        id="tags",
+    ),
+    pytest.param({"tags": []}, "_print_tags", ("None",), (), id="tags-empty"),
+    pytest.param(
+        {"time_variable": "Census Year"},
+        "_print_time_and_spatial",
+        ("Time Variable:", "Census Year"),
+        (),
+        id="time-variable",
+    ),
+    pytest.param(
+        {"geographic": True, "spatial_key": "County"},
+        "_print_time_and_spatial",
+        ("Geographic Variable:", "County"),
+        (),
+        id="spatial",
+    ),
+    pytest.param(
+        {"geographic": False},
+        "_print_time_and_spatial",
+        (),
+        ("Geographic Variable:",),
+        id="spatial-absent",
+    ),
+    pytest.param(
+        {"last_updated": _LAST_UPDATED},
+        "_print_updated",
+        ("Last Updated:", "2023-06-15"),
+        (),
+        id="updated",
+    ),
+    pytest.param(
+        {"last_updated": _LAST_UPDATED, "reasons": ["Monthly update", "Data revision"]},
+        "_print_updated",
+        ("2023-06-15", "Reason for Release:", "Monthly update"),
+        (),
+        id="updated-reasons",
+    ),
+    pytest.param(
+        {"last_updated": None}, "_print_updated", (), ("Last Updated:",), id="updated-absent"
+    ),
+    pytest.param(
+        {"notes": ["This is a test note about the dataset."]},
+        "_print_notes",
+        ("Notes:", "This is a test note"),
+        (),
+        id="notes",
+    ),
+    pytest.param(
+        {"notes": ["First note.", "Second note.", "Third note."]},
+        "_print_notes",
+        ("First note.", "Second note.", "Third note."),
+        (),
+        id="notes-multiple",
+    ),
+    pytest.param(
+        {"notes": ["This is a very long note " * 20]},
+        "_print_notes",
+        ("very long note",),
+        (),
+        id="notes-long",
+    ),
+    pytest.param({"notes": []}, "_print_notes", (), ("Notes:",), id="notes-absent"),
+    pytest.param(
+        {
+            "contact_name": "John Doe",
+            "contact_email": "john@example.com",
+            "contact_phone": "+353 1 234 5678",
+        },
+        "_print_contact",
+        ("Contact Name:", "John Doe", "Contact Email:", "john@example.com"),
+        (),
+        id="contact",
+    ),
+    pytest.param(
+        {"contact_name": "John Doe", "contact_phone": "+353 1 234 5678"},
+        "_print_contact",
+        ("Contact Phone:", "+353 1 234 5678"),
+        (),
+        id="contact-phone",
+    ),
+    pytest.param(
+        {"contact_name": "John Doe", "contact_email": None, "contact_phone": None},
+        "_print_contact",
+        ("Contact Name:", "John Doe"),
+        ("Contact Email:",),
+        id="contact-partial",
+    ),
+    pytest.param({}, "_print_contact", (), ("Contact Name:",), id="contact-absent"),
+    pytest.param(
+        {"copyright_name": "Central Statistics Office", "copyright_href": None},
+        "_print_copyright",
+        ("Copyright:", "Central Statistics Office"),
+        ("(",),
+        id="copyright-without-href",
+    ),
+    pytest.param(
+        {"copyright_name": None, "copyright_href": None},
+        "_print_copyright",
+        (),
+        ("Copyright:",),
+        id="copyright-absent",
+    ),
+]
+
+
+class TestMetadataPrinterSections:
+    """Tests for the output of each individual section."""
+
+    @pytest.mark.parametrize(("fields", "method", "expected", "unexpected"), _PRINT_CASES)
+    def test_print_section(self, fields, method, expected, unexpected):
+        """Test that a section prints the expected text and none of the unexpected."""
+        output = _render(DatasetMetadata(**fields), method)
+
+        _assert_contains_all(output, *expected)
+        present = [text for text in unexpected if text in output]
+        assert not present, f"Unexpected in output: {present}"
 
 
 class TestMetadataPrinterPrintLine:
     """Tests for _print_line helper method."""
 
-    def test_print_line_alignment(self, capsys):
+    def test_print_line_alignment(self, buffer, empty_printer):
         """Test that print_line aligns correctly."""
-        metadata = DatasetMetadata()
-        printer = MetadataPrinter(metadata)
-        printer._print_line("Label:", "Value")
+        empty_printer._print_line("Label:", "Value")
 
-        captured = capsys.readouterr()
-        assert "Label:" in captured.out
-        assert "Value" in captured.out
+        output = buffer.getvalue()
+        assert "Label:" in output
+        assert "Value" in output
 
 
 class TestMetadataPrinterPrintWrapped:
     """Tests for _print_wrapped helper method."""
 
-    def test_print_wrapped_short_text(self, capsys):
+    def test_print_wrapped_short_text(self, buffer, empty_printer):
         """Test wrapping short text."""
-        metadata = DatasetMetadata()
-        printer = MetadataPrinter(metadata)
-        printer._print_wrapped("Short text", initial_indent=" " * 10)
+        empty_printer._print_wrapped("Short text", initial_indent=" " * 10)
 
-        captured = capsys.readouterr()
-        assert "Short text" in captured.out
+        output = buffer.getvalue()
+        assert "Short text" in output
 
-    def test_print_wrapped_long_text(self, capsys):
+    def test_print_wrapped_long_text(self, buffer, empty_printer):
         """Test wrapping long text."""
-        metadata = DatasetMetadata()
-        printer = MetadataPrinter(metadata)
         long_text = "This is a very long text that should be wrapped across multiple lines " * 5
-        printer._print_wrapped(long_text, initial_indent=" " * 10)
+        empty_printer._print_wrapped(long_text, initial_indent=" " * 10)
 
-        captured = capsys.readouterr()
-        assert "very long text" in captured.out
+        output = buffer.getvalue()
+        assert "very long text" in output
 
 
 class TestMetadataPrinterEdgeCases:
     """Edge case tests for MetadataPrinter."""
 
-    def test_print_all_with_minimal_metadata(self, capsys):
+    def test_print_all_with_minimal_metadata(self, buffer, empty_printer):
         """Test print_all with minimal metadata."""
-        metadata = DatasetMetadata()
-        printer = MetadataPrinter(metadata)
-        printer.print_all()
+        empty_printer.print_all()
 
-        captured = capsys.readouterr()
+        output = buffer.getvalue()
         # Should not raise, even with minimal metadata
-        assert "Code:" in captured.out
+        assert "Code:" in output
 
-    def test_print_header_unknown_code(self, capsys):
+    def test_print_header_unknown_code(self):
         """Test header with None table code."""
         metadata = DatasetMetadata(table_code=None)  # type: ignore
-        printer = MetadataPrinter(metadata)
-        printer._print_header()
+        output = _render(metadata, "_print_header")
 
-        captured = capsys.readouterr()
         # None is printed when table_code is None
-        assert "None" in captured.out or "Code:" in captured.out
+        assert "None" in output or "Code:" in output
 
-    def test_drop_filtered_cols_with_non_matching_filter(self, capsys):
+    def test_drop_filtered_cols_with_non_matching_filter(self):
         """Test drop_filtered_cols when filter doesn't match a variable."""
         metadata = DatasetMetadata(
             variables=["County", "Year"],
@@ -463,24 +418,50 @@ class TestMetadataPrinterEdgeCases:
             units=[],
         )
         filters: dict = {"NonExistent": ["Value"]}
-        printer = MetadataPrinter(metadata, filters=filters, drop_filtered_cols=True)
-        printer._print_variables()
+        output = _render(metadata, "_print_variables", filters=filters, drop_filtered_cols=True)
 
-        captured = capsys.readouterr()
         # Should still print all variables
-        assert "County" in captured.out
-        assert "Year" in captured.out
+        assert "County" in output
+        assert "Year" in output
 
-    def test_statistics_index_out_of_range(self, capsys):
+    def test_statistics_index_out_of_range(self):
         """Test handling when statistics index is out of range for units."""
         metadata = DatasetMetadata(
             variables=["STATISTIC"],
             statistics=["Pop", "Rate", "Count"],
             units=["Number"],  # Only one unit, but 3 statistics
         )
-        printer = MetadataPrinter(metadata)
-        printer._print_variables()
+        output = _render(metadata, "_print_variables")
 
-        captured = capsys.readouterr()
         # Should handle gracefully with "N/A" for missing units
-        assert "Pop" in captured.out
+        assert "Pop" in output
+
+
+class TestMetadataPrinterFullOutput:
+    """Tests against print_all() output for fully populated metadata."""
+
+    def test_includes_header_and_variables(self, full_output):
+        """Test that the header and variable sections are present."""
+        _assert_contains_all(full_output, "FY003A", "Test Dataset", "Variables:", "Population")
+
+    def test_includes_time_and_spatial(self, full_output):
+        """Test that the time and geographic variables are present."""
+        _assert_contains_all(full_output, "Time Variable:", "Geographic Variable:", "County")
+
+    def test_includes_update_and_notes(self, full_output):
+        """Test that the update date, reason and notes are present."""
+        _assert_contains_all(
+            full_output, "2023-06-15", "Data revision", "Notes:", "A note about the dataset."
+        )
+
+    def test_includes_contact_and_copyright(self, full_output):
+        """Test that contact and copyright details are present."""
+        _assert_contains_all(
+            full_output, "john@example.com", "+353 1 234 5678", "Central Statistics Office"
+        )
+
+    def test_sections_in_print_order(self, full_output):
+        """Test that sections appear in the order print_all emits them."""
+        labels = ["Code:", "Variables:", "Tags:", "Time Variable:", "Last Updated:", "Notes:"]
+        positions = [full_output.index(label) for label in labels]
+        assert positions == sorted(positions)
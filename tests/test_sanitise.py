@@ -1,6 +1,8 @@
 """Tests for the sanitise module."""
 
+from pycsodata.constants import SANITISATION_DICT
 from pycsodata.sanitise import (
+    _sanitise_str,
     create_reverse_mapping,
     create_sanitisation_mapping,
     sanitise_dict_keys,
@@ -52,6 +54,21 @@ class TestSanitiseString:
         assert sanitise_string(123) == 123  # type: ignore
         assert sanitise_string(None) is None  # type: ignore
 
+    def test_sanitisation_dict_keys_are_already_clean(self):
+        """Test that every SANITISATION_DICT key is unchanged by the cleaning steps.
+
+        sanitise_string maps exact keys directly, which relies on this.
+        """
+        for key in SANITISATION_DICT:
+            assert _sanitise_str(key) == SANITISATION_DICT[key]
+
+    def test_repeated_values_served_from_cache(self):
+        """Test that sanitising the same label twice reuses the first result."""
+        _sanitise_str.cache_clear()
+        assert sanitise_string("Counties & Cities") == "County and City"
+        assert sanitise_string("Counties & Cities") == "County and City"
+        assert _sanitise_str.cache_info().hits == 1
+
 
 class TestSanitiseList:
     """Tests for sanitise_list function."""
@@ -99,8 +116,22 @@ class TestSanitiseDictValues:
 
     def test_non_string_values_passthrough(self):
         """Test that non-string values pass through."""
-        result = sanitise_dict_values({"num": 123, "bool": True})
+        values = {"num": 123, "bool": True}
+        result = sanitise_dict_values(values)
         assert result == {"num": 123, "bool": True}
+        assert result is values
+
+    def test_clean_values_return_input(self):
+        """Test that a dictionary needing no sanitisation is returned as is."""
+        values = {"name": "County", "names": ["County", "Year"], "count": 32}
+        assert sanitise_dict_values(values) is values
+
+    def test_input_not_mutated(self):
+        """Test that changed values are written to a copy, not the input."""
+        values = {"name": "Counties", "count": 32}
+        result = sanitise_dict_values(values)
+        assert result == {"name": "County", "count": 32}
+        assert values == {"name": "Counties", "count": 32}
 
 
 class TestCreateSanitisationMapping:
@@ -128,3 +159,10 @@ class TestCreateReverseMapping:
             "County": "Counties",
             "Normal": "Normal",
         }
+
+    def test_reverse_mapping_inverts_sanitisation_mapping(self):
+        """Test that the reverse mapping is the inverse of the forward mapping."""
+        names = ["Counties", "NUTS 3 Regions", "A  &  B"]
+        forward = create_sanitisation_mapping(names)
+        reverse = create_reverse_mapping(names)
+        assert {reverse[sanitised]: sanitised for sanitised in reverse} == forward
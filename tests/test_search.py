@@ -2,18 +2,24 @@
 
 from datetime import date
 
+import pandas as pd
+
 from pycsodata.search import (
+    _match_all,
+    _parse_date_range,
     _parse_primary,
     _parse_string_primary,
     _tokenise_expression,
     adjust_date_to_period_end,
     count_matching_terms,
+    count_matching_terms_series,
     date_in_date_range,
     date_range_overlaps,
     extract_search_terms,
     parse_date_input,
     parse_date_range_tuple,
     parse_search_expression,
+    parse_single_term,
     parse_string_search_expression,
 )
 
@@ -27,6 +33,12 @@ class TestParseSearchExpression:
         assert matcher(["foo", "bar"]) is True
         assert matcher([]) is True
 
+    def test_blank_queries_share_match_all(self):
+        """Test that blank queries return the shared match-all matcher."""
+        assert parse_search_expression("") is _match_all
+        assert parse_search_expression("   ") is _match_all
+        assert parse_string_search_expression("") is _match_all
+
     def test_simple_term_match(self):
         """Test matching a simple term."""
         matcher = parse_search_expression("foo")
@@ -37,6 +49,7 @@ class TestParseSearchExpression:
         """Test that matching is case-insensitive."""
         matcher = parse_search_expression("FOO")
         assert matcher(["foo bar", "baz"]) is True
+        assert matcher(["FOO BAR", "baz"]) is True
 
     def test_and_expression(self):
         """Test AND expression matching."""
@@ -72,6 +85,11 @@ class TestParseSearchExpression:
         assert matcher(["City Population", "Other"]) is True
         assert matcher(["County", "Other"]) is False
 
+    def test_repeated_query_reuses_matcher(self):
+        """Test that parsing the same query twice returns the cached matcher."""
+        matcher = parse_search_expression("(Cork OR Dublin) AND Population")
+        assert parse_search_expression("(Cork OR Dublin) AND Population") is matcher
+
 
 class TestParseStringSearchExpression:
     """Tests for the parse_string_search_expression function."""
@@ -111,6 +129,33 @@ class TestParseStringSearchExpression:
         matcher = parse_string_search_expression("population")
         assert matcher(None) is False  # type: ignore
 
+    def test_not_expression_on_empty_text(self):
+        """Test that a negated term matches empty text."""
+        matcher = parse_string_search_expression("NOT census")
+        assert matcher("") is True
+
+    def test_repeated_query_reuses_matcher(self):
+        """Test that parsing the same query twice returns the cached matcher."""
+        matcher = parse_string_search_expression("population AND NOT census")
+        assert parse_string_search_expression("population AND NOT census") is matcher
+
+
+class TestParseSingleTerm:
+    """Tests for the parse_single_term function."""
+
+    def test_single_word(self):
+        """Test that a single word is returned lowercased."""
+        assert parse_single_term("Population") == "population"
+
+    def test_quoted_phrase(self):
+        """Test that a quoted phrase counts as a single term."""
+        assert parse_single_term('"Census Year"') == "census year"
+
+    def test_expressions_return_none(self):
+        """Test that anything other than one plain term returns None."""
+        for query in ("population AND county", "NOT census", "a b", "AND", "(", '""', ""):
+            assert parse_single_term(query) is None, query
+
 
 class TestParseDateInput:
     """Tests for the parse_date_input function."""
@@ -233,6 +278,23 @@ class TestDateInDateRange:
         assert date_in_date_range(date(2020, 1, 1), "year", "") is False
         assert date_in_date_range(date(2020, 1, 1), "year", None) is False  # type: ignore
 
+    def test_nan_range_returns_false(self):
+        """Test that a missing range from a DataFrame column returns False."""
+        assert date_in_date_range(date(2020, 1, 1), "year", float("nan")) is False  # type: ignore
+
+    def test_range_parsed_once(self):
+        """Test that a repeated range string is parsed once and then reused."""
+        _parse_date_range.cache_clear()
+        for year in (2014, 2015, 2020):
+            date_in_date_range(date(year, 1, 1), "year", "2015 - 2024")
+        info = _parse_date_range.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_parse_date_range_adjusts_end(self):
+        """Test that the parsed end date is moved to the end of its period."""
+        assert _parse_date_range("2022 January - 2025 Q1") == (date(2022, 1, 1), date(2025, 3, 31))
+        assert _parse_date_range("2015 - 2020 - 2024") is None
+
 
 class TestDateRangeOverlaps:
     """Tests for the date_range_overlaps function."""
@@ -294,6 +356,21 @@ class TestTokeniseExpression:
         tokens = _tokenise_expression("   ")
         assert tokens == []
 
+    def test_tokenise_unterminated_quote(self):
+        """Test that an unterminated quote runs to the end of the query."""
+        tokens = _tokenise_expression('term "open phrase  ')
+        assert tokens == ["term", "open phrase"]
+
+    def test_tokenise_empty_quotes(self):
+        """Test that empty quotes produce an empty token."""
+        tokens = _tokenise_expression('a "" b')
+        assert tokens == ["a", "", "b"]
+
+    def test_tokenise_quote_and_parenthesis_split_words(self):
+        """Test that quotes and parentheses end a word without whitespace."""
+        tokens = _tokenise_expression('a(b)c"d e"f')
+        assert tokens == ["a", "(", "b", ")", "c", "d e", "f"]
+
     def test_tokenise_complex_expression(self):
         """Test tokenising complex expression."""
         tokens = _tokenise_expression('(County OR "City Region") AND Population')
@@ -318,6 +395,14 @@ class TestParsePrimary:
         # Should skip AND and match "foo"
         assert matcher(["foo"]) is True
 
+    def test_parse_long_operator_run(self):
+        """Test that a long run of stray operators is skipped without recursing."""
+        tokens = ["AND", "OR", "NOT"] * 2000 + ["foo"]
+        pos = [0]
+        matcher = _parse_primary(tokens, pos)
+        assert matcher(["foo"]) is True
+        assert pos == [len(tokens)]
+
 
 class TestParseStringPrimary:
     """Tests for _parse_string_primary function."""
@@ -337,6 +422,14 @@ class TestParseStringPrimary:
         # Should skip OR and match "foo"
         assert matcher("foo bar") is True
 
+    def test_parse_long_operator_run(self):
+        """Test that a long run of stray operators is skipped without recursing."""
+        tokens = ["NOT"] * 5000 + ["foo"]
+        pos = [0]
+        matcher = _parse_string_primary(tokens, pos)
+        assert matcher("foo bar") is True
+        assert pos == [len(tokens)]
+
     def test_parse_parentheses(self):
         """Test parsing parenthesized expression."""
         tokens = ["(", "foo", ")"]
@@ -402,6 +495,12 @@ class TestParseDateInputEdgeCases:
         result, _granularity = parse_date_input("2023-13")
         assert result is None
 
+    def test_invalid_iso_date(self):
+        """Test an ISO-shaped date that does not exist returns None."""
+        result, granularity = parse_date_input("2023-02-30")
+        assert result is None
+        assert granularity == ""
+
     def test_european_date_format(self):
         """Test European date format (day first)."""
         result, granularity = parse_date_input("15/01/2023")
@@ -442,6 +541,11 @@ class TestAdjustDateToPeriodEndEdgeCases:
         result = adjust_date_to_period_end(date(2023, 10, 1), "quarter")
         assert result == date(2023, 12, 31)
 
+    def test_quarter_from_mid_quarter_date(self):
+        """Test that any date in a quarter adjusts to that quarter's end."""
+        assert adjust_date_to_period_end(date(2023, 2, 14), "quarter") == date(2023, 3, 31)
+        assert adjust_date_to_period_end(date(2023, 6, 30), "quarter") == date(2023, 6, 30)
+
     def test_month_december(self):
         """Test December month adjustment."""
         result = adjust_date_to_period_end(date(2023, 12, 1), "month")
@@ -699,3 +803,25 @@ class TestCountMatchingTerms:
         """Test counting with None text."""
         count = count_matching_terms(None, ["electoral", "division"])  # type: ignore
         assert count == 0
+
+
+class TestCountMatchingTermsSeries:
+    """Tests for the count_matching_terms_series function."""
+
+    def test_matches_scalar_counts(self):
+        """Test that counts agree with count_matching_terms for each text."""
+        texts = ["Electoral Division Population", "Population by County", "ELECTORAL", ""]
+        terms = ["electoral", "division", "population"]
+        counts = count_matching_terms_series(pd.Series(texts), terms)
+        assert counts.tolist() == [count_matching_terms(text, terms) for text in texts]
+
+    def test_missing_text_counts_zero(self):
+        """Test that missing texts count as zero."""
+        counts = count_matching_terms_series(pd.Series([None, "Population"]), ["population"])
+        assert counts.tolist() == [0, 1]
+
+    def test_preserves_index(self):
+        """Test that counts are aligned with the input index."""
+        texts = pd.Series(["Population", "County"], index=[10, 20])
+        counts = count_matching_terms_series(texts, ["county"])
+        assert counts.to_dict() == {10: 0, 20: 1}
@@ -10,9 +10,13 @@ from shapely.geometry.base import BaseGeometry
 
 from pycsodata.constants import DEFAULT_CRS, MET_EIREANN_SPATIAL_KEY
 from pycsodata.exceptions import SpatialError
+from pycsodata.fetchers import flush_cache
 from pycsodata.spatial import (
+    _boundaries_from_geojson,
+    _boundary_cache,
     _build_weather_stations_gdf,
     _detect_crs,
+    _map_geometries,
     _merge_dataframes,
     create_geodataframe,
     create_met_geodataframe,
@@ -53,20 +57,43 @@ class TestDetectCRS:
         assert _detect_crs(geojson) == "EPSG:4326"
 
 
+@pytest.fixture(scope="module")
+def county_boundaries() -> gpd.GeoDataFrame:
+    """Two county boundaries keyed by code, shared because merging never mutates them."""
+    return gpd.GeoDataFrame({"code": ["IE061", "IE062"], "geometry": [Point(0, 0), Point(1, 1)]})
+
+
+class TestMapGeometries:
+    """Tests for the _map_geometries function."""
+
+    def test_maps_repeated_and_unmatched_keys(self):
+        """Test that repeated keys share a geometry and unmatched keys get None."""
+        keys = pd.Series(["B", "A", "B", "Z"], index=[7, 8, 9, 10])
+        geometries = pd.Series([Point(0, 0), Point(1, 1)])
+
+        result = _map_geometries(keys, pd.Series(["A", "B"]), geometries)
+
+        assert list(result.index) == [7, 8, 9, 10]
+        assert result.tolist() == [Point(1, 1), Point(0, 0), Point(1, 1), None]
+
+    def test_no_boundaries_maps_all_to_none(self):
+        """Test that an empty boundary set leaves every key unmatched."""
+        result = _map_geometries(pd.Series(["A"]), pd.Series([], dtype=object), pd.Series([]))
+        assert result.tolist() == [None]
+
+
 class TestMergeDataframes:
     """Tests for the _merge_dataframes function."""
 
-    def test_merge_on_id_column(self):
+    def test_merge_on_id_column(self, county_boundaries):
         """Test merging on ID column with code."""
         df = pd.DataFrame(
             {"County": ["Dublin", "Cork"], "County ID": ["IE061", "IE062"], "value": [100, 200]}
         )
 
-        gdf = gpd.GeoDataFrame({"code": ["IE061", "IE062"], "geometry": [Point(0, 0), Point(1, 1)]})
-
         geojson = {"features": []}
 
-        result = _merge_dataframes(df, gdf, "County", geojson)
+        result = _merge_dataframes(df, county_boundaries, "County", geojson)
 
         assert isinstance(result, gpd.GeoDataFrame)
         assert len(result) == 2
@@ -87,7 +114,7 @@ class TestMergeDataframes:
         assert isinstance(result, gpd.GeoDataFrame)
         assert len(result) == 2
 
-    def test_merge_preserves_unmatched_rows_with_null_geometry(self):
+    def test_merge_preserves_unmatched_rows_with_null_geometry(self, county_boundaries):
         """Test that left join preserves rows without matching geometry."""
         # Simulate aggregate region like 'State' that has no matching geometry
         df = pd.DataFrame(
@@ -98,12 +125,10 @@ class TestMergeDataframes:
             }
         )
 
-        # GeoJSON only has Dublin and Cork, not State
-        gdf = gpd.GeoDataFrame({"code": ["IE061", "IE062"], "geometry": [Point(0, 0), Point(1, 1)]})
-
+        # The boundaries only have Dublin and Cork, not State
         geojson = {"features": []}
 
-        result = _merge_dataframes(df, gdf, "County", geojson)
+        result = _merge_dataframes(df, county_boundaries, "County", geojson)
 
         # Result should not be None
         assert result is not None
@@ -120,6 +145,24 @@ class TestMergeDataframes:
         dublin_row = result[result["County"] == "Dublin"]
         assert not dublin_row.geometry.isna().any()
 
+    def test_merge_rejects_duplicate_boundary_keys(self):
+        """Test that duplicate usable boundary keys raise SpatialError."""
+        df = pd.DataFrame({"County ID": ["IE061"], "value": [1]})
+        gdf = gpd.GeoDataFrame({"code": ["IE061", "IE061"], "geometry": [Point(0, 0), Point(1, 1)]})
+
+        with pytest.raises(SpatialError, match="not unique"):
+            _merge_dataframes(df, gdf, "County", {"features": []})
+
+    def test_merge_does_not_mutate_input_and_resets_index(self, county_boundaries):
+        """Test that the input DataFrame is untouched and the result is re-indexed."""
+        df = pd.DataFrame({"County ID": ["IE061", "IE062"], "value": [1, 2]}, index=[10, 20])
+        result = _merge_dataframes(df, county_boundaries, "County", {"features": []})
+
+        assert result is not None
+        assert "geometry" not in df.columns
+        assert list(result.index) == [0, 1]
+        assert list(result.columns) == ["County ID", "value", "geometry"]
+
     def test_merge_fails_no_suitable_columns(self):
         """Test that merge fails when no suitable columns found."""
         df = pd.DataFrame({"Region": ["A", "B"], "value": [100, 200]})
@@ -276,6 +319,115 @@ class TestCreateGeoDataFrameEdgeCases:
                     create_geodataframe(df, "http://example.com/geo.json", "County")
 
 
+def _point_geojson(code: str) -> dict:
+    """A single-feature GeoJSON with a point boundary for the given code."""
+    return {
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [-6.26, 53.35]},
+                "properties": {"code": code},
+            }
+        ]
+    }
+
+
+class TestBoundariesFromGeojson:
+    """Tests for the _boundaries_from_geojson function."""
+
+    def test_reuses_gdf_for_same_cached_response(self):
+        """Test that the same GeoJSON object from one URL is only converted once."""
+        geojson = _point_geojson("IE061")
+        url = "http://example.com/reuse.json"
+
+        first = _boundaries_from_geojson(url, geojson, cache=True)
+        second = _boundaries_from_geojson(url, geojson, cache=True)
+
+        assert second is first
+
+    def test_rebuilds_for_new_response(self):
+        """Test that a fresh GeoJSON object for the same URL is converted again."""
+        url = "http://example.com/refresh.json"
+
+        first = _boundaries_from_geojson(url, _point_geojson("IE061"), cache=True)
+        second = _boundaries_from_geojson(url, _point_geojson("IE062"), cache=True)
+
+        assert second is not first
+        assert second["code"].tolist() == ["IE062"]
+
+    def test_cache_disabled_always_rebuilds(self):
+        """Test that cache=False neither reads nor stores a GeoDataFrame."""
+        geojson = _point_geojson("IE061")
+        url = "http://example.com/uncached.json"
+
+        first = _boundaries_from_geojson(url, geojson, cache=False)
+        second = _boundaries_from_geojson(url, geojson, cache=False)
+
+        assert second is not first
+
+    def test_drops_null_and_empty_boundaries(self):
+        """Test that unusable boundary features are dropped before caching."""
+        geojson = {
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    "properties": {"code": "IE061"},
+                },
+                {"type": "Feature", "geometry": None, "properties": {"code": "IE062"}},
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": []},
+                    "properties": {"code": "IE063"},
+                },
+            ]
+        }
+
+        gdf = _boundaries_from_geojson("http://example.com/unusable.json", geojson, cache=True)
+
+        assert gdf["code"].tolist() == ["IE061"]
+        assert str(gdf.crs) == DEFAULT_CRS
+
+    def test_unusable_duplicate_boundaries_do_not_block_merge(self):
+        """Test that a key duplicated only by a null boundary still merges."""
+        df = pd.DataFrame({"County ID": ["IE061", "IE062"], "value": [1, 2]})
+        geojson = _point_geojson("IE061")
+        geojson["features"].append(
+            {"type": "Feature", "geometry": None, "properties": {"code": "IE061"}}
+        )
+
+        with patch("pycsodata.spatial.fetch_json", return_value=geojson):
+            result = create_geodataframe(df, "http://example.com/dupes.json", "County")
+
+        assert result.geometry.isna().tolist() == [False, True]
+
+    def test_flush_cache_clears_boundaries(self):
+        """Test that flush_cache drops cached boundary GeoDataFrames."""
+        geojson = _point_geojson("IE061")
+        url = "http://example.com/flushed.json"
+
+        first = _boundaries_from_geojson(url, geojson, cache=True)
+        assert url in _boundary_cache
+
+        flush_cache()
+
+        assert len(_boundary_cache) == 0
+        assert _boundaries_from_geojson(url, geojson, cache=True) is not first
+
+    def test_repeated_create_geodataframe_leaves_boundaries_intact(self):
+        """Test that merging twice from a cached response gives the same result."""
+        df = pd.DataFrame({"County ID": ["IE061", "IE0"], "value": [1, 2]})
+        geojson = _point_geojson("IE061")
+
+        with patch("pycsodata.spatial.fetch_json", return_value=geojson):
+            first = create_geodataframe(df, "http://example.com/twice.json", "County")
+            second = create_geodataframe(df, "http://example.com/twice.json", "County")
+
+        assert second is not first
+        assert second.geometry.isna().tolist() == [False, True]
+        assert first.geometry.equals(second.geometry)
+
+
 class TestBuildWeatherStationsGdf:
     """Tests for _build_weather_stations_gdf function."""
 
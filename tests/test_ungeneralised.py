@@ -589,6 +589,15 @@ class TestForce2D:
         result = _force_2d(gdf)
         assert not cast("BaseGeometry", result.geometry.iloc[0]).has_z
 
+    def test_preserves_crs_and_index(self):
+        """Test that forcing to 2D keeps the CRS and row index."""
+        poly_z = Polygon([(0, 0, 10), (1, 0, 20), (1, 1, 30), (0, 0, 10)])
+        gdf = gpd.GeoDataFrame({"a": [1]}, geometry=[poly_z], index=[7], crs="EPSG:2157")
+        result = _force_2d(gdf)
+        assert result.crs == gdf.crs
+        assert list(result.index) == [7]
+        assert cast("BaseGeometry", gdf.geometry.iloc[0]).has_z  # input left untouched
+
     def test_handles_null_geometries(self):
         """Test that null geometries are preserved."""
         from shapely.geometry import Polygon as ShapelyPolygon
@@ -1360,7 +1369,7 @@ class TestCSODatasetUngeneralised:
         with (
             patch("pycsodata.dataset.load_metadata") as mock_meta,
             patch("pycsodata.dataset.extract_spatial_info") as mock_spatial,
-            patch("pycsodata.dataset.create_geodataframe") as mock_create_gdf,
+            patch("pycsodata.spatial.create_geodataframe") as mock_create_gdf,
         ):
             mock_meta.return_value = {"dimension": {}}
             mock_spatial.return_value = MagicMock(
@@ -1415,7 +1424,7 @@ class TestCSODatasetUngeneralised:
         with (
             patch("pycsodata.dataset.load_metadata") as mock_meta,
             patch("pycsodata.dataset.extract_spatial_info") as mock_spatial,
-            patch("pycsodata.dataset.create_ungeneralised_geodataframe") as mock_create,
+            patch("pycsodata.ungeneralised.create_ungeneralised_geodataframe") as mock_create,
         ):
             mock_meta.return_value = {"dimension": {}}
             mock_spatial.return_value = MagicMock(
@@ -1459,7 +1468,7 @@ class TestCSODatasetUngeneralised:
         with (
             patch("pycsodata.dataset.load_metadata") as mock_meta,
             patch("pycsodata.dataset.extract_spatial_info") as mock_spatial,
-            patch("pycsodata.dataset.create_ungeneralised_geodataframe") as mock_create,
+            patch("pycsodata.ungeneralised.create_ungeneralised_geodataframe") as mock_create,
         ):
             mock_meta.return_value = {"dimension": {}}
             mock_spatial.return_value = MagicMock(
@@ -1483,6 +1492,7 @@ class TestCSODatasetUngeneralised:
             dataset._is_met_dataset = False
             dataset._cached_gdf = None
             dataset._cached_gdf_ungeneralised = gdf1  # Previously cached
+            dataset._cached_pivots = {}
             dataset._filters = None
             dataset._drop_filtered_cols = False
             dataset._cache_enabled = True